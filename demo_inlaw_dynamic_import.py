@@ -9,8 +9,13 @@ from plainerflow import InLaw
 def main():
     """Demonstrate InLaw dynamic import functionality."""
     
-    # Create a simple in-memory SQLite database for demonstration
-    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    # Create a simple in-memory SQLite database for demonstration. StaticPool keeps
+    # one connection, so the database survives between connect() calls.
+    engine = sqlalchemy.create_engine(
+        "sqlite:///:memory:",
+        poolclass=sqlalchemy.pool.StaticPool,
+        connect_args={"check_same_thread": False}
+    )
     
     print("=== InLaw Dynamic Import Demonstration ===\n")
     
@@ -0,0 +1,16 @@
+"""
+Shared path setup for the example scripts.
+
+Importing this module puts the repository root on sys.path (once) so the
+examples can import plainerflow without it being pip-installed.
+"""
+
+import sys
+from pathlib import Path
+
+# Repository root, resolved once
+ROOT = Path(__file__).resolve().parent.parent
+
+_root = str(ROOT)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
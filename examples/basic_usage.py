@@ -5,12 +5,9 @@ Basic usage example for plainerflow package
 
 # Example of importing plainerflow after manual path setup
 # (for environments where pip is not available)
-import sys
-import os
-
 # Add the parent directory to the path so we can import plainerflow
 # In a real scenario, this would be the path to where plainerflow is located
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _bootstrap import ROOT  # noqa: F401
 
 # Now import plainerflow
 import plainerflow
@@ -7,10 +7,9 @@ and how it gracefully falls back through different connection methods.
 """
 
 import sys
-from pathlib import Path
 
 # Add the parent directory to the path so we can import plainerflow
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from _bootstrap import ROOT  # noqa: F401
 
 from plainerflow import CredentialFinder
 
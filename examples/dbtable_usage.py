@@ -9,14 +9,36 @@ This example demonstrates the key features of DBTable including:
 - SQLAlchemy ORM integration (when dependencies are available)
 """
 
-import sys
-import os
-
 # Add the parent directory to the path so we can import plainerflow
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _bootstrap import ROOT  # noqa: F401
 
 from plainerflow import DBTable, DBTableValidationError, DBTableHierarchyError
 
+# Pipeline SQL templates, defined once at import time and filled with DBTable names per run.
+# Table names are identifiers, so they are formatted in; values would be bound parameters.
+EXTRACT_SQL = "SELECT * FROM {source} WHERE date >= '2024-01-01'"
+
+TRANSFORM_SQL = """
+    INSERT INTO {target}
+    SELECT 
+        event_id,
+        LOWER(event_type) as event_type,
+        user_id,
+        timestamp
+    FROM {source}
+    WHERE event_type IS NOT NULL
+    """
+
+LOAD_SQL = """
+    INSERT INTO {target}
+    SELECT 
+        DATE(timestamp) as event_date,
+        event_type,
+        COUNT(*) as event_count
+    FROM {source}
+    GROUP BY DATE(timestamp), event_type
+    """
+
 
 def basic_usage_examples():
     """Demonstrate basic DBTable usage."""
@@ -171,9 +193,10 @@ def sqlalchemy_integration_example():
     
     try:
         from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String
+        from sqlalchemy.pool import StaticPool
         
         # Create in-memory SQLite database for demo
-        engine = create_engine("sqlite:///:memory:")
+        engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
         
         # Create a test table
         metadata = MetaData()
@@ -218,28 +241,10 @@ def practical_example():
     print(f"2. Cleaned data: {clean_events}")
     print(f"3. Aggregated data: {aggregated_events}")
     
-    # Generate SQL for the pipeline
-    extract_sql = f"SELECT * FROM {raw_events} WHERE date >= '2024-01-01'"
-    transform_sql = f"""
-    INSERT INTO {clean_events}
-    SELECT 
-        event_id,
-        LOWER(event_type) as event_type,
-        user_id,
-        timestamp
-    FROM {raw_events}
-    WHERE event_type IS NOT NULL
-    """
-    
-    load_sql = f"""
-    INSERT INTO {aggregated_events}
-    SELECT 
-        DATE(timestamp) as event_date,
-        event_type,
-        COUNT(*) as event_count
-    FROM {clean_events}
-    GROUP BY DATE(timestamp), event_type
-    """
+    # Generate SQL for the pipeline from the module-level templates
+    extract_sql = EXTRACT_SQL.format(source=raw_events)
+    transform_sql = TRANSFORM_SQL.format(target=clean_events, source=raw_events)
+    load_sql = LOAD_SQL.format(target=aggregated_events, source=clean_events)
     
     print("\nGenerated SQL:")
     print("Extract:", extract_sql)
@@ -11,6 +11,7 @@ This example demonstrates the key features of FrostDict:
 
 import plainerflow
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 
 def main():
@@ -78,7 +79,7 @@ def main():
     
     # Example 5: Integration with SQLoopcicle
     print("\n5. Integration with SQLoopcicle:")
-    engine = create_engine("sqlite:///:memory:")
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
     
     sql_workflow = plainerflow.FrostDict({
         "create_users": "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)",
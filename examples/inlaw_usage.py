@@ -5,24 +5,21 @@ This demonstrates how to create custom validation tests using the InLaw framewor
 """
 
 import sqlalchemy
+from sqlalchemy.pool import StaticPool
 from plainerflow import InLaw
 
 
 # Example 1: Row count validation (< 100 rows) - Most common pattern
+# Single-value checks declare probe_sql + check(); run_all fuses all of these
+# into one SELECT so they cost a single database round-trip together.
 class InLawTableRowCountCheck(InLaw):
     title = "Ensure test_table has < 100 rows"
+    probe_sql = "SELECT COUNT(*) FROM test_table"
 
     @staticmethod
-    def run(engine):
+    def check(value):
         # Common pattern: SELECT COUNT(*) and check it's under a threshold
-        sql = "SELECT COUNT(*) AS row_count FROM test_table"
-        count_gx_df = InLaw.sql_to_gx_df(sql=sql, engine=engine)
-        
-        result = count_gx_df.expect_column_values_to_be_between(
-            column="row_count", min_value=0, max_value=99
-        )
-        
-        if result.success:
+        if value < 100:
             return True
         return "Table has too many rows, expected < 100"
 
@@ -30,16 +27,12 @@ class InLawTableRowCountCheck(InLaw):
 # Example 2: Zero rows returned - Second most common pattern
 class InLawNoInvalidRecords(InLaw):
     title = "Check for zero invalid records"
+    probe_sql = "SELECT COUNT(*) FROM test_table WHERE value < 0"  # Should return 0
 
     @staticmethod
-    def run(engine):
-        # Common pattern: Query should return zero rows (no problems found)
-        sql = "SELECT COUNT(*) as invalid_count FROM test_table WHERE value < 0"  # Should return 0
-        invalid_gx_df = InLaw.sql_to_gx_df(sql=sql, engine=engine)
-        
-        # Check that count is zero
-        result = invalid_gx_df.expect_column_values_to_be_between(column="invalid_count", min_value=0, max_value=0)
-        if result.success:
+    def check(value):
+        # Common pattern: Query should find zero problem rows
+        if value == 0:
             return True
         return "Found invalid records with negative values"
 
@@ -47,18 +40,12 @@ class InLawNoInvalidRecords(InLaw):
 # Example 3: Exactly one row returned - Third most common pattern  
 class InLawSingleConfigRecord(InLaw):
     title = "Verify exactly one configuration record exists"
+    probe_sql = "SELECT COUNT(*) FROM test_table WHERE name = 'Alice'"
 
     @staticmethod
-    def run(engine):
-        # Common pattern: Query should return exactly one row
-        sql = "SELECT COUNT(*) as config_count FROM test_table WHERE name = 'Alice'"
-        config_gx_df = InLaw.sql_to_gx_df(sql=sql, engine=engine)
-        
-        result = config_gx_df.expect_column_values_to_be_between(
-            column="config_count", min_value=1, max_value=1
-        )
-        
-        if result.success:
+    def check(value):
+        # Common pattern: Query should find exactly one row
+        if value == 1:
             return True
         return "Expected exactly 1 Alice record, but count was different"
 
@@ -66,44 +53,31 @@ class InLawSingleConfigRecord(InLaw):
 # Example 4: Single row with numeric value in range - Fourth most common pattern
 class InLawNumericValueInRange(InLaw):
     title = "Verify numeric column value is between 7 and 10"
+    probe_sql = "SELECT value FROM test_table WHERE name = 'Bob'"
 
     @staticmethod
-    def run(engine):
+    def check(value):
         # Common pattern: Single row query with numeric value validation
-        sql = "SELECT value as this_particular_col FROM test_table WHERE name = 'Bob'"
-        numeric_gx_df = InLaw.sql_to_gx_df(sql=sql, engine=engine)
-        
-        result = numeric_gx_df.expect_column_values_to_be_between(
-            column="this_particular_col", min_value=7, max_value=10
-        )
-        
-        if result.success:
+        if value is not None and 7 <= value <= 10:
             return True
         return "Value is not between 7 and 10"
 
 
-# Example 5: Single row with non-null VARCHAR - Fifth most common pattern
+# Example 5: No NULL or blank VARCHAR values - Fifth most common pattern
 class InLawVarcharNotBlankOrNull(InLaw):
     title = "Verify VARCHAR column is not blank or NULL"
+    # The NULL/blank test runs in the database; only the count of offending rows comes back
+    probe_sql = "SELECT COUNT(*) FROM test_table WHERE name IS NULL OR TRIM(name) = ''"
 
     @staticmethod
-    def run(engine):
-        # Common pattern: Single row query with VARCHAR validation
-        sql = "SELECT name as that_other_col FROM test_table WHERE name = 'Alice'"
-        varchar_gx_df = InLaw.sql_to_gx_df(sql=sql, engine=engine)
-        
-        # Check column is not null
-        result_not_null = varchar_gx_df.expect_column_values_to_not_be_null(
-            column="that_other_col"
-        )
-        
-        if not result_not_null.success:
-            return "Column 'that_other_col' contains NULL values"
-        
-        return True
+    def check(value):
+        # Common pattern: no row may have a NULL or blank name
+        if value == 0:
+            return True
+        return f"Found {value} rows with a NULL or blank name"
 
 
-# Example 6: Always failing test for demonstration
+# Example 6: Always failing test for demonstration (uses the full GX run() form)
 class InLawAlwaysFailsTest(InLaw):
     title = "Test that always fails (for demo)"
 
@@ -122,6 +96,27 @@ class InLawAlwaysFailsTest(InLaw):
         return "Value is not between 0 and 50"
 
 
+# Example 7: Declarative form - one GX expectation, no run() method needed
+class InLawValuesWithinRange(InLaw):
+    title = "Verify every value is between 0 and 1000"
+    sql = "SELECT value FROM test_table"
+    expect = ("between", "value", 0, 1000)
+    fail_msg = "Some values are outside 0-1000"
+
+
+# Example 8: Zero offending rows, counted in the database rather than in pandas
+class InLawNoDuplicateNames(InLaw):
+    title = "Verify names are unique"
+
+    @staticmethod
+    def run(engine):
+        return InLaw.assert_zero_rows(
+            sql="SELECT name FROM test_table GROUP BY name HAVING COUNT(*) > 1",
+            engine=engine,
+            fail_msg="Found duplicate names"
+        )
+
+
 def main():
     """
     Example of how to use InLaw with a database connection.
@@ -130,8 +125,14 @@ def main():
     SQLAlchemy-supported database.
     """
     
-    # Create a simple in-memory SQLite database for demonstration
-    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    # Create a simple in-memory SQLite database for demonstration. StaticPool
+    # keeps its one connection (and the data) alive, and lets run_all share it
+    # across its worker threads.
+    engine = sqlalchemy.create_engine(
+        "sqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
     
     # Create a simple test table
     with engine.connect() as conn:
@@ -7,13 +7,14 @@ with a SQLite database.
 """
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
 from plainerflow import SQLoopcicle
 
 def main():
     """Demonstrate SQLoopcicle usage."""
     
     # Create an in-memory SQLite database for demonstration
-    engine = create_engine("sqlite:///:memory:")
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
     
     # Define a series of SQL operations
     sql_operations = {
@@ -95,6 +96,23 @@ def main():
             for row in result:
                 print(f"  {row}")
     
+    print("\n" + "=" * 60 + "\n")
+    
+    # Statements can also come from a generator of (key, sql) pairs; each one is
+    # built only when the loop reaches it, so large batches are never held in memory
+    print("4. STREAMING MODE (statements produced by a generator):")
+    print("-" * 50)
+    
+    def archive_statements():
+        yield "create_archive", "CREATE TABLE orders_archive AS SELECT * FROM orders WHERE 1 = 0"
+        for user_id in range(1, 4):
+            yield (
+                f"archive_user_{user_id}",
+                f"INSERT INTO orders_archive SELECT * FROM orders WHERE user_id = {user_id}"
+            )
+    
+    SQLoopcicle.run_sql_loop(archive_statements(), engine, is_just_print=False, is_do_beep=False)
+    
     print("\n" + "=" * 60)
     print("Demo complete! SQLoopcicle successfully executed all SQL operations.")
 
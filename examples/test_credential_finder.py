@@ -8,10 +8,9 @@ the SQLite fallback functionality.
 
 import sys
 import os
-from pathlib import Path
 
 # Add the parent directory to the path so we can import plainerflow
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from _bootstrap import ROOT  # noqa: F401
 
 import plainerflow
 from plainerflow import CredentialFinder
@@ -27,11 +26,7 @@ def test_sqlite_fallback():
     print(f"Engine URL: {engine.url}")
     
     # Test a simple query
-    with engine.connect() as conn:
-        from sqlalchemy import text
-        result = conn.execute(text("SELECT 1 as test_value"))
-        row = result.fetchone()
-        print(f"Test query result: {row}")
+    print(f"Test query result: {CredentialFinder.ping(engine)}")
     
     print("✓ SQLite fallback test passed!\n")
 
@@ -50,11 +45,7 @@ def test_sqlite_override():
     print(f"Engine URL: {engine.url}")
     
     # Test a simple query
-    with engine.connect() as conn:
-        from sqlalchemy import text
-        result = conn.execute(text("SELECT 'custom db' as test_value"))
-        row = result.fetchone()
-        print(f"Test query result: {row}")
+    print(f"Test query result: {CredentialFinder.ping(engine)}")
     
     # Clean up
     if os.path.exists(custom_db):
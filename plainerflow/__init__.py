@@ -2,42 +2,59 @@
 plainerflow - A Python package for plain flow operations
 """
 
-import warnings
-
-# Suppress Marshmallow warnings before importing InLaw (which imports Great Expectations)
-# These are version compatibility issues between Great Expectations and Marshmallow
-# that will be resolved in future GX releases
-try:
-    from marshmallow.warnings import ChangedInMarshmallow4Warning
-    warnings.filterwarnings(
-        "ignore",
-        message=r".*Number.*field should not be instantiated.*Use.*Integer.*Float.*or.*Decimal.*instead.*",
-        category=ChangedInMarshmallow4Warning
-    )
-except ImportError:
-    # Fallback if marshmallow warnings module structure changes
-    warnings.filterwarnings(
-        "ignore",
-        message=r".*Number.*field should not be instantiated.*Use.*Integer.*Float.*or.*Decimal.*instead.*"
-    )
+import importlib
+import sys
+from typing import TYPE_CHECKING
 
 __version__ = "0.1.0"
 __author__ = "Fred Trotter"
 __email__ = "fred.trotter@gmail.com"
 
-# Import all main classes/functions here so they're available when someone does:
+# Main classes/functions are available when someone does:
 # import plainerflow
+#
+# Each name maps to the submodule that defines it. Submodules are imported on
+# first attribute access (PEP 562), so `import plainerflow` stays cheap and
+# doesn't pull in SQLAlchemy or Great Expectations until they are needed.
+# As we add more classes later, they should be added here.
+_LAZY = {
+    "CredentialFinder": ".credential_finder",
+    "InLaw": ".inlaw",
+    "DBTable": ".dbtable",
+    "DBTableError": ".dbtable",
+    "DBTableValidationError": ".dbtable",
+    "DBTableHierarchyError": ".dbtable",
+    "SQLoopcicle": ".sqloopcicle",
+    "FrostDict": ".frostdict",
+    "FrozenKeyError": ".frostdict",
+}
 
-from .credential_finder import CredentialFinder
-from .inlaw import InLaw
-from .dbtable import DBTable, DBTableError, DBTableValidationError, DBTableHierarchyError
-from .sqloopcicle import SQLoopcicle
-from .frostdict import FrostDict, FrozenKeyError
+if TYPE_CHECKING:
+    from .credential_finder import CredentialFinder
+    from .inlaw import InLaw
+    from .dbtable import DBTable, DBTableError, DBTableValidationError, DBTableHierarchyError
+    from .sqloopcicle import SQLoopcicle
+    from .frostdict import FrostDict, FrozenKeyError
 
-# As we add more classes later, they should be imported here
-# Example:
-# from .some_module import SomeClass
-# from .another_module import AnotherClass
+
+def __getattr__(name):
+    """Import the submodule defining name on first access and cache the result."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    modules = sys.modules
+    module = modules.get(__name__ + module_name)
+    if module is None:
+        module = importlib.import_module(module_name, __name__)
+    
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     "__version__", 
@@ -6,12 +6,113 @@ SQLAlchemy Engine, falling back to local SQLite so pipelines always have
 something to run against.
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import atexit
+import weakref
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-import sqlalchemy
-from sqlalchemy import create_engine
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlalchemy
+
+
+# Variables a .env file (or the environment) must provide for a server database
+_REQUIRED_ENV_VARS: Tuple[str, ...] = ('GX_USERNAME', 'GX_PASSWORD', 'DB_DATABASE', 'DB_PORT', 'DB_HOST')
+
+# SQLAlchemy driver for each DB_TYPE value; unlisted types use DB_TYPE lowercased
+# (SQLITE is file-based and handled separately in _build_sql_url)
+_DRIVER_MAPPING: Mapping[str, str] = MappingProxyType({
+    'POSTGRESQL': 'postgresql+psycopg2',
+    'MYSQL': 'mysql+pymysql',
+    'ORACLE': 'oracle+cx_oracle',
+    'SQLSERVER': 'mssql+pyodbc',
+    'MSSQL': 'mssql+pyodbc'
+})
+
+
+def _build_sql_url(
+    database_type: str,
+    *,
+    username: Optional[str],
+    password: Optional[str],
+    host: Optional[str],
+    port: Optional[str],
+    database: Optional[str]
+) -> str:
+    """Build the SQLAlchemy URL for a DB_TYPE value (upper case) and its credentials."""
+    if database_type == 'SQLITE':
+        # For SQLite, we only need the database path (ignore host/port/username/password)
+        return f"sqlite:///{database or 'plainerflow.db'}"
+    driver = _DRIVER_MAPPING.get(database_type, database_type.lower())
+    return f"{driver}://{username}:{password}@{host}:{port}/{database}"
+
+
+def create_engine(*args: Any, **kwargs: Any) -> sqlalchemy.engine.Engine:
+    """sqlalchemy.create_engine, imported on first use so importing this module stays cheap."""
+    from sqlalchemy import create_engine as _create_engine
+    return _create_engine(*args, **kwargs)
+
+
+class _Capabilities(NamedTuple):
+    """Optional connection sources installed in this interpreter."""
+    has_spark: bool
+    has_colab: bool
+
+
+def _has_module(name: str, subpackage: Optional[str] = None) -> bool:
+    """
+    Whether a top-level module (and optionally a subpackage of it) is installed,
+    found without importing anything.
+
+    ``find_spec`` on a dotted name would import the parent package and run its
+    ``__init__``, so a subpackage is looked for in the parent's search locations.
+    """
+    full_name = f"{name}.{subpackage}" if subpackage else name
+    if sys.modules.get(full_name) is not None:
+        return True  # Already imported
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return False  # Broken installation
+    if spec is None:
+        return False
+    if subpackage is None:
+        return True
+    return any(
+        os.path.isdir(os.path.join(location, subpackage))
+        for location in spec.submodule_search_locations or ()
+    )
+
+
+@lru_cache(maxsize=1)
+def _env_capabilities() -> _Capabilities:
+    """Look up the optional sources once per process."""
+    return _Capabilities(
+        has_spark=_has_module("pyspark"),
+        has_colab=_has_module("google", "colab"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _fallback_db_path() -> str:
+    """Path of the last-resort SQLite database (~/plainerflow_fallback.db), resolved once."""
+    return str(Path.home() / "plainerflow_fallback.db")
+
+
+def _file_version(file_stat: os.stat_result) -> tuple:
+    """Identify one version of a file: (st_dev, st_ino, st_size, st_mtime_ns)."""
+    return (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+# Parsed .env files keyed by _file_version; see CredentialFinder._read_env_file
+_ENV_FILE_CACHE: Dict[tuple, Dict[str, Optional[str]]] = {}
+_ENV_FILE_CACHE_SIZE = 32
 
 
 class CredentialFinder:
@@ -20,13 +121,25 @@ class CredentialFinder:
     across different environments (Spark, Google Colab, .env files, SQLite fallback).
     """
     
+    # Testing PostgreSQL container (and its default engine) shared by every fallback in this process
+    _postgres_container = None
+    _postgres_engine = None
+    
+    # Engines that already passed the is_validate connection test
+    _validated_engines: weakref.WeakKeyDictionary[sqlalchemy.engine.Engine, bool] = weakref.WeakKeyDictionary()
+    
+    # Which source produced each engine, so a cached detect_config(verbose=True) can still say
+    _chosen_sources: weakref.WeakKeyDictionary[sqlalchemy.engine.Engine, str] = weakref.WeakKeyDictionary()
+    
     @staticmethod
     def detect_config(
         *, 
         env_path: Optional[str] = ".env", 
         verbose: bool = False,
         sqlite_db_file: Optional[str] = None,
-        password_worksheet: str = "DatawarehouseUP"
+        password_worksheet: str = "DatawarehouseUP",
+        is_validate: bool = False,
+        pool_opts: Optional[Dict[str, Any]] = None
     ) -> sqlalchemy.engine.Engine:
         """
         Detects the best available connection source, in order of precedence,
@@ -49,6 +162,13 @@ class CredentialFinder:
             If provided, forces SQLite usage with this file path, bypassing all other detection.
         password_worksheet : str
             Name of the Google Drive worksheet containing credentials (for Colab mode).
+        is_validate : bool
+            If True, run ``SELECT 1`` through the engine before returning it. This
+            costs a database round-trip, so it is off by default and done only
+            once per engine.
+        pool_opts : dict | None
+            Extra ``create_engine`` keyword arguments (``pool_size``, ``pool_recycle``,
+            ``poolclass``, ...). Without them SQLAlchemy's pool defaults apply.
 
         Returns
         -------
@@ -58,37 +178,99 @@ class CredentialFinder:
         Raises
         ------
         RuntimeError
-            If dependencies for a detected source are missing or credentials are incomplete.
+            If dependencies for a detected source are missing or credentials are incomplete,
+            or if ``is_validate`` is True and the database cannot be reached.
+
+        Notes
+        -----
+        The engine is cached per set of arguments and version of the .env file, so
+        repeated calls return the same Engine (and connection pool) without running
+        the detection again. Call ``clear_cache()`` after changing ``os.environ`` or
+        other sources. ``sqlite_db_file=":memory:"`` always returns a new, empty database.
         """
+        pool_items = tuple(sorted((pool_opts or {}).items()))
+        
+        # Each in-memory database is private to its engine, so never hand one out twice
+        if sqlite_db_file == ":memory:":
+            engine = CredentialFinder._create_sqlite_engine(sqlite_db_file, pool_opts=pool_opts)
+        else:
+            env_version = None
+            if sqlite_db_file is None and env_path is not None:
+                try:
+                    env_version = _file_version(os.stat(env_path))
+                except OSError:
+                    pass  # No .env file; _probe_sources will report it absent
+            
+            detect = CredentialFinder._detect_config_cached
+            try:
+                hash(pool_items)
+            except TypeError:
+                detect = detect.__wrapped__  # Unhashable pool options (e.g. connect_args): skip the cache
+            engine = detect(env_path, env_version, sqlite_db_file, password_worksheet, pool_items)
+        
+        if verbose:
+            # Printed here rather than during detection, so cached calls report it too
+            source = CredentialFinder._chosen_sources.get(engine)
+            if source is not None:
+                print(source)
+        
+        if is_validate:
+            CredentialFinder._validate_engine(engine)
+        return engine
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _detect_config_cached(
+        env_path: Optional[str],
+        env_version: Optional[tuple],
+        sqlite_db_file: Optional[str],
+        password_worksheet: str,
+        pool_items: tuple = ()
+    ) -> sqlalchemy.engine.Engine:
+        """
+        Run the detection cascade for detect_config; results are cached by its arguments.
+
+        ``env_version`` is part of the cache key, so an edited .env file is
+        detected again, and is None when there is no .env file. ``pool_items`` is ``pool_opts`` as sorted (name, value)
+        pairs. ``verbose`` is not an argument, so quiet and verbose calls share one
+        engine; detect_config prints the chosen source itself. Failures (exceptions)
+        are not cached.
+        """
+        pool_opts = dict(pool_items)
         
         # Priority 1: SQLite Override
         if sqlite_db_file is not None:
-            return CredentialFinder._create_sqlite_engine(sqlite_db_file, verbose)
+            return CredentialFinder._create_sqlite_engine(sqlite_db_file, pool_opts=pool_opts)
+        
+        # Check which sources are present at all before trying them in order
+        available = CredentialFinder._probe_sources(env_version is not None)
         
         # Priority 2: Spark Session
-        try:
-            engine = CredentialFinder._try_spark_connection(verbose)
-            if engine is not None:
-                return engine
-        except RuntimeError:
-            raise  # Re-raise RuntimeError for missing dependencies
-        except Exception:
-            pass  # Continue to next priority
+        if available["spark"]:
+            try:
+                engine = CredentialFinder._try_spark_connection(pool_opts)
+                if engine is not None:
+                    return engine
+            except RuntimeError:
+                raise  # Re-raise RuntimeError for missing dependencies
+            except Exception:
+                pass  # Continue to next priority
         
         # Priority 3: Google Colab
-        try:
-            engine = CredentialFinder._try_colab_connection(password_worksheet, verbose)
-            if engine is not None:
-                return engine
-        except RuntimeError:
-            raise  # Re-raise RuntimeError for missing dependencies
-        except Exception:
-            pass  # Continue to next priority
+        if available["colab"]:
+            try:
+                engine = CredentialFinder._try_colab_connection(password_worksheet, pool_opts)
+                if engine is not None:
+                    return engine
+            except RuntimeError:
+                raise  # Re-raise RuntimeError for missing dependencies
+            except Exception:
+                pass  # Continue to next priority
         
         # Priority 4: .env File
-        if env_path is not None:
+        if available["env"]:
             try:
-                engine = CredentialFinder._try_env_connection(env_path, verbose)
+                engine = CredentialFinder._try_env_connection(env_path, pool_opts)
                 if engine is not None:
                     return engine
             except RuntimeError:
@@ -97,22 +279,117 @@ class CredentialFinder:
                 pass  # Continue to fallback
         
         # Priority 5: PostgreSQL Testing Fallback
-        return CredentialFinder._create_testing_postgresql_engine(verbose)
+        return CredentialFinder._create_testing_postgresql_engine(pool_opts)
+    
+    @staticmethod
+    def _remember_source(engine: sqlalchemy.engine.Engine, message: str) -> sqlalchemy.engine.Engine:
+        """Record the message detect_config prints (when verbose) for engine, and return engine."""
+        CredentialFinder._chosen_sources[engine] = message
+        return engine
+    
+    @staticmethod
+    def _validate_engine(engine: sqlalchemy.engine.Engine) -> None:
+        """
+        Check once per engine that it can reach its database.
+
+        Raises
+        ------
+        RuntimeError
+            If the connection test fails.
+        """
+        if CredentialFinder._validated_engines.get(engine):
+            return
+        try:
+            CredentialFinder.ping(engine)
+        except Exception as e:
+            raise RuntimeError(f"Connection test failed for {engine.url!r}: {str(e)}") from e
+        CredentialFinder._validated_engines[engine] = True
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Forget the engines returned by earlier detect_config calls.
+
+        The next call runs the full detection again, picking up changes to
+        environment variables or credential sources.
+        """
+        CredentialFinder._detect_config_cached.cache_clear()
+    
+    @staticmethod
+    def ping(engine: sqlalchemy.engine.Engine) -> Any:
+        """
+        Run a trivial ``SELECT 1`` to confirm that an engine can reach its database.
+
+        The statement goes straight to the DBAPI cursor via ``exec_driver_sql``,
+        skipping SQLAlchemy's statement compilation, on a pooled connection.
+
+        Parameters
+        ----------
+        engine : sqlalchemy.engine.Engine
+            The engine to check, typically one returned by ``detect_config``.
+
+        Returns
+        -------
+        Any
+            The scalar returned by the database (``1`` on every supported backend).
+        """
+        with engine.connect() as conn:
+            return conn.exec_driver_sql("SELECT 1").scalar()
     
     @staticmethod
-    def _try_spark_connection(verbose: bool) -> Optional[sqlalchemy.engine.Engine]:
+    def _probe_sources(has_env: bool) -> Dict[str, bool]:
+        """
+        Check which connection sources are present.
+        
+        Installed modules are looked up once per process, without importing them.
+        The active Spark session is only looked up when PySpark is installed.
+        Nothing is authenticated or connected, so a source reported as present
+        may still turn out to be unusable when it is tried.
+        
+        Parameters
+        ----------
+        has_env : bool
+            Whether detect_config found the .env file (its version could be read).
+
+        Returns
+        -------
+        dict
+            Maps "spark", "colab" and "env" to whether that source is present.
+        """
+        capabilities = _env_capabilities()
+        return {
+            "spark": capabilities.has_spark and CredentialFinder._detect_spark(),
+            "colab": capabilities.has_colab,
+            "env": has_env,
+        }
+    
+    @staticmethod
+    def _detect_spark() -> bool:
+        """Whether an active Spark session exists (or the check itself failed)."""
+        try:
+            from pyspark.sql import SparkSession
+            return SparkSession.getActiveSession() is not None
+        except ImportError:
+            return False
+        except Exception:
+            return True  # Let _try_spark_connection report the configuration problem
+    
+    @staticmethod
+    def _try_spark_connection(pool_opts: Optional[Dict[str, Any]] = None) -> Optional[sqlalchemy.engine.Engine]:
         """
         Attempt to detect and connect via Spark session.
         
         Returns None if Spark is not available.
         Raises RuntimeError if Spark is detected but dependencies are missing.
         """
+        # Check if pyspark is available without running its (slow) package init
+        if not _has_module("pyspark"):
+            return None  # Spark not available, continue to next priority
+        
         try:
-            # Check if pyspark is available
-            import pyspark
             from pyspark.sql import SparkSession
         except ImportError:
-            return None  # Spark not available, continue to next priority
+            return None  # Installed but not importable, continue to next priority
         
         try:
             # Check for active Spark session
@@ -130,14 +407,13 @@ class CredentialFinder:
                 pass
             
             if jdbc_url:
-                if verbose:
-                    print("[CredentialFinder] Using Spark session credentials.")
-                return create_engine(jdbc_url)
+                return CredentialFinder._remember_source(
+                    create_engine(jdbc_url, **(pool_opts or {})),
+                    "[CredentialFinder] Using Spark session credentials."
+                )
             else:
                 # Build a databricks connector URL if no JDBC URL found
                 # This is a simplified approach - in practice, you'd need more config
-                if verbose:
-                    print("[CredentialFinder] Using Spark session credentials (databricks connector).")
                 # For now, we'll fall through to next priority if no JDBC URL is configured
                 return None
                 
@@ -146,29 +422,29 @@ class CredentialFinder:
             raise RuntimeError(f"Spark session detected but connection failed: {str(e)}")
     
     @staticmethod
-    def _try_colab_connection(password_worksheet: str, verbose: bool) -> Optional[sqlalchemy.engine.Engine]:
+    def _try_colab_connection(
+        password_worksheet: str,
+        pool_opts: Optional[Dict[str, Any]] = None
+    ) -> Optional[sqlalchemy.engine.Engine]:
         """
         Attempt to detect and connect via Google Colab credentials.
         
         Returns None if not in Colab environment.
         Raises RuntimeError if in Colab but dependencies are missing.
         """
-        try:
-            # Check if we're in Google Colab
-            import google.colab
-        except ImportError:
+        # Check if we're in Google Colab without importing it
+        if not _has_module("google", "colab"):
             return None  # Not in Colab, continue to next priority
         
         try:
             # Import required Google API dependencies
             import gspread
-            import pandas as pd
             from google.auth import default
             from google.colab import auth
         except ImportError as e:
             raise RuntimeError(
                 f"Google Colab detected but required dependencies missing: {str(e)}. "
-                "Install with: pip install gspread google-auth pandas"
+                "Install with: pip install gspread google-auth"
             )
         
         try:
@@ -179,75 +455,150 @@ class CredentialFinder:
             
             # Open the specified worksheet
             worksheet = gc.open(password_worksheet).sheet1
-            rows = worksheet.get_all_values()
-            df = pd.DataFrame(rows)
-            
-            # Convert first row to column headers
-            df.columns = df.iloc[0]
-            df = df.iloc[1:]
             
-            # Extract credentials from first data row
-            username = df.iat[0, 0]
-            password = df.iat[0, 1]
-            server = df.iat[0, 2]
-            port = str(df.iat[0, 3])
-            database = df.iat[0, 4]
+            # Only the first data row (row 2, under the header row) holds the
+            # credentials, so fetch just that row instead of the whole sheet
+            username, password, server, port, database = worksheet.row_values(2)[:5]
+            port = str(port)
             
             # Build MySQL connection string
             sql_url = f"mysql+pymysql://{username}:{password}@{server}:{port}/{database}"
             
-            if verbose:
-                print("[CredentialFinder] Using Google Colab credentials.")
-            
-            return create_engine(sql_url)
+            return CredentialFinder._remember_source(
+                create_engine(sql_url, **(pool_opts or {})),
+                "[CredentialFinder] Using Google Colab credentials."
+            )
             
         except Exception as e:
             raise RuntimeError(f"Google Colab credentials access failed: {str(e)}")
     
     @staticmethod
-    def _create_testing_postgresql_engine(verbose: bool) -> sqlalchemy.engine.Engine:
+    def _create_testing_postgresql_engine(
+        pool_opts: Optional[Dict[str, Any]] = None
+    ) -> sqlalchemy.engine.Engine:
         """
         Create a testing PostgreSQL engine using testcontainers.
         
+        When it falls back to SQLite, the reason is part of the source message
+        detect_config prints.
+        
         Parameters
         ----------
-        verbose : bool
-            Whether to print verbose output.
+        pool_opts : dict | None
+            Extra ``create_engine`` keyword arguments.
         """
         try:
             from testcontainers.postgres import PostgreSqlContainer
         except ImportError:
             # Fall back to SQLite if testcontainers is not available
-            if verbose:
-                print("[CredentialFinder] testcontainers not available, falling back to SQLite")
-            fallback_path = str(Path.home() / "plainerflow_fallback.db")
-            return CredentialFinder._create_sqlite_engine(fallback_path, verbose, is_fallback=True)
+            return CredentialFinder._create_sqlite_fallback_engine(
+                "testcontainers not available", pool_opts=pool_opts
+            )
         
         try:
-            # Create a PostgreSQL container and store it globally to keep it alive
-            postgres_container = PostgreSqlContainer("postgres:13")
-            postgres_container.start()
+            # Start the container once per process; later fallbacks reuse it (and its
+            # engine) instead of paying the multi-second container start again
+            postgres_container = CredentialFinder._postgres_container
+            if postgres_container is not None and not CredentialFinder._is_container_running(postgres_container):
+                postgres_container = None  # Stopped or removed outside this process; start a new one
+                CredentialFinder._postgres_engine = None
             
-            # Store the container globally so it doesn't get garbage collected
-            CredentialFinder._postgres_container = postgres_container
+            if postgres_container is None:
+                postgres_container = PostgreSqlContainer("postgres:13")
+                postgres_container.start()
+                
+                # Store the container globally so it doesn't get garbage collected,
+                # and stop it when the interpreter exits
+                CredentialFinder._postgres_container = postgres_container
+                atexit.register(postgres_container.stop)
             
             # Get the connection URL
             connection_url = postgres_container.get_connection_url()
             
-            if verbose:
-                print(f"[CredentialFinder] Using testcontainers PostgreSQL database: {connection_url}")
-            
-            return create_engine(connection_url)
+            if pool_opts:
+                engine = create_engine(connection_url, **pool_opts)
+            else:
+                if CredentialFinder._postgres_engine is None:
+                    CredentialFinder._postgres_engine = create_engine(connection_url)
+                engine = CredentialFinder._postgres_engine
+            return CredentialFinder._remember_source(
+                engine, f"[CredentialFinder] Using testcontainers PostgreSQL database: {connection_url}"
+            )
             
         except Exception as e:
             # Fall back to SQLite if PostgreSQL setup fails
-            if verbose:
-                print(f"[CredentialFinder] PostgreSQL container setup failed ({str(e)}), falling back to SQLite")
-            fallback_path = str(Path.home() / "plainerflow_fallback.db")
-            return CredentialFinder._create_sqlite_engine(fallback_path, verbose, is_fallback=True)
+            return CredentialFinder._create_sqlite_fallback_engine(
+                f"PostgreSQL container setup failed ({str(e)})", pool_opts=pool_opts
+            )
+    
+    @staticmethod
+    def _create_sqlite_fallback_engine(
+        reason: str,
+        *,
+        pool_opts: Optional[Dict[str, Any]] = None
+    ) -> sqlalchemy.engine.Engine:
+        """Create the local SQLite fallback engine, recording why it was needed in its source message."""
+        engine = CredentialFinder._create_sqlite_engine(
+            _fallback_db_path(), is_fallback=True, pool_opts=pool_opts
+        )
+        return CredentialFinder._remember_source(
+            engine,
+            f"[CredentialFinder] {reason}, falling back to SQLite\n{CredentialFinder._chosen_sources[engine]}"
+        )
+    
+    @staticmethod
+    def _is_container_running(container: Any) -> bool:
+        """Whether a testcontainers container is still running, according to Docker."""
+        try:
+            wrapped = container.get_wrapped_container()
+            wrapped.reload()
+            return wrapped.status == "running"
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _read_env_file(env_path: str) -> Dict[str, Optional[str]]:
+        """
+        Return the variables defined in a .env file, parsing it only when it changes.
+        
+        The file is opened once: fstat() on the open handle identifies its version
+        (device, inode, size, mtime), and on a cache miss the same handle is parsed.
+        There is no separate existence check that could race with the read.
+        
+        Parameters
+        ----------
+        env_path : str
+            Path to the .env file.
+
+        Returns
+        -------
+        dict
+            Variable names mapped to their values (None for bare names).
+
+        Raises
+        ------
+        OSError
+            If the file cannot be opened (missing, a directory, unreadable).
+        ImportError
+            If the file has to be parsed and python-dotenv is not installed.
+        """
+        with open(env_path, encoding="utf-8") as env_file:
+            env_stat = os.fstat(env_file.fileno())
+            file_id = _file_version(env_stat)
+            values = _ENV_FILE_CACHE.get(file_id)
+            if values is None:
+                from dotenv import dotenv_values
+                values = dict(dotenv_values(stream=env_file))
+                if len(_ENV_FILE_CACHE) >= _ENV_FILE_CACHE_SIZE:
+                    _ENV_FILE_CACHE.clear()
+                _ENV_FILE_CACHE[file_id] = values
+        return dict(values)
     
     @staticmethod
-    def _try_env_connection(env_path: str, verbose: bool) -> Optional[sqlalchemy.engine.Engine]:
+    def _try_env_connection(
+        env_path: str,
+        pool_opts: Optional[Dict[str, Any]] = None
+    ) -> Optional[sqlalchemy.engine.Engine]:
         """
         Attempt to connect using .env file credentials.
         
@@ -257,72 +608,58 @@ class CredentialFinder:
 
         is_debug = True
 
-        if not os.path.exists(env_path):
-            return None  # .env file doesn't exist, continue to fallback
-        
+        # Opening the file is the existence check; there is no separate stat to race with
         try:
-            from dotenv import load_dotenv
+            env_values = CredentialFinder._read_env_file(env_path)
+        except OSError:
+            return None  # .env file doesn't exist (or is a directory), continue to fallback
         except ImportError:
             raise RuntimeError(
                 f".env file found at {env_path} but python-dotenv not installed. "
                 "Install with: pip install python-dotenv"
             )
         
-        # Load environment variables
-        load_dotenv(env_path)
+        # Load environment variables (existing ones win, as with load_dotenv)
+        for name, value in env_values.items():
+            if value is not None:
+                os.environ.setdefault(name, value)
         
-        # Check for required credentials
-        required_vars = ['GX_USERNAME', 'GX_PASSWORD', 'DB_DATABASE', 'DB_PORT', 'DB_HOST']
-        missing_vars = []
-        
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        # Check for required credentials, reading each variable from the environment once
+        settings = {var: os.environ.get(var) for var in _REQUIRED_ENV_VARS}
+        missing_vars = [var for var in _REQUIRED_ENV_VARS if not settings[var]]
         
         if missing_vars:
             raise RuntimeError(
                 f"Incomplete .env credentials. Missing variables: {', '.join(missing_vars)}"
             )
         
-        # Build connection string
-        username = os.getenv('GX_USERNAME')
-        password = os.getenv('GX_PASSWORD')
-        database = os.getenv('DB_DATABASE')
-        port = os.getenv('DB_PORT')
-        host = os.getenv('DB_HOST')
-        
-        database_type = os.getenv('DB_TYPE', 'MYSQL').upper()  # Default to MYSQL if not specified
+        database_type = os.environ.get('DB_TYPE', 'MYSQL').upper()  # Default to MYSQL if not specified
 
         if(is_debug):
             print(f"CredentialFinder: Detected DB_TYPE of {database_type}")
 
         # Build connection string based on database type
-        if database_type == 'POSTGRESQL':
-            sql_url = f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}"
-        elif database_type == 'MYSQL':
-            sql_url = f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
-        elif database_type == 'SQLITE':
-            # For SQLite, we only need the database path (ignore host/port/username/password)
-            sqlite_path = database if database else 'plainerflow.db'
-            sql_url = f"sqlite:///{sqlite_path}"
-        else:
-            # For other database types, try a generic approach
-            # This covers databases like Oracle, SQL Server, etc.
-            driver_mapping = {
-                'ORACLE': 'oracle+cx_oracle',
-                'SQLSERVER': 'mssql+pyodbc',
-                'MSSQL': 'mssql+pyodbc'
-            }
-            driver = driver_mapping.get(database_type, database_type.lower())
-            sql_url = f"{driver}://{username}:{password}@{host}:{port}/{database}"
-        
-        if verbose:
-            print(f"[CredentialFinder] Using .env file credentials from {env_path}.")
+        sql_url = _build_sql_url(
+            database_type,
+            username=settings['GX_USERNAME'],
+            password=settings['GX_PASSWORD'],
+            host=settings['DB_HOST'],
+            port=settings['DB_PORT'],
+            database=settings['DB_DATABASE']
+        )
         
-        return create_engine(sql_url)
+        return CredentialFinder._remember_source(
+            create_engine(sql_url, **(pool_opts or {})),
+            f"[CredentialFinder] Using .env file credentials from {env_path}."
+        )
     
     @staticmethod
-    def _create_sqlite_engine(db_path: str, verbose: bool, is_fallback: bool = False) -> sqlalchemy.engine.Engine:
+    def _create_sqlite_engine(
+        db_path: str,
+        is_fallback: bool = False,
+        *,
+        pool_opts: Optional[Dict[str, Any]] = None
+    ) -> sqlalchemy.engine.Engine:
         """
         Create a SQLite engine with the specified database path.
         
@@ -330,11 +667,27 @@ class CredentialFinder:
         ----------
         db_path : str
             Path to the SQLite database file.
-        verbose : bool
-            Whether to print verbose output.
         is_fallback : bool
-            Whether this is being used as a fallback (affects verbose message).
+            Whether this is being used as a fallback (affects the source message).
+        pool_opts : dict | None
+            Extra ``create_engine`` keyword arguments.
         """
+        # An in-memory database lives only as long as its connection, so keep one
+        # shared connection (StaticPool) instead of a fresh empty database per connect()
+        if db_path == ":memory:":
+            from sqlalchemy.pool import StaticPool
+            engine = create_engine(
+                "sqlite:///:memory:",
+                **{
+                    "poolclass": StaticPool,
+                    "connect_args": {"check_same_thread": False},
+                    **(pool_opts or {})
+                }
+            )
+            return CredentialFinder._remember_source(
+                engine, f"[CredentialFinder] Using SQLite database: {db_path}"
+            )
+        
         # Expand user home directory if needed
         if db_path.startswith("~/"):
             db_path = str(Path.home() / db_path[2:])
@@ -345,10 +698,8 @@ class CredentialFinder:
         
         sql_url = f"sqlite:///{db_path}"
         
-        if verbose:
-            if is_fallback:
-                print(f"[CredentialFinder] Falling back to local SQLite database: {db_path}")
-            else:
-                print(f"[CredentialFinder] Using SQLite database: {db_path}")
-        
-        return create_engine(sql_url)
+        if is_fallback:
+            message = f"[CredentialFinder] Falling back to local SQLite database: {db_path}"
+        else:
+            message = f"[CredentialFinder] Using SQLite database: {db_path}"
+        return CredentialFinder._remember_source(create_engine(sql_url, **(pool_opts or {})), message)
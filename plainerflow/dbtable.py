@@ -7,10 +7,10 @@ reflection capabilities.
 """
 
 import re
+import weakref
 from typing import Optional, Dict, List, Any, Union
 from sqlalchemy import create_engine, MetaData, Table
 from sqlalchemy.orm import DeclarativeBase
-from pprint import pprint
 
 class DBTableError(Exception):
     """Base exception for DBTable-related errors."""
@@ -53,6 +53,9 @@ class DBTable:
         'view': ['view', 'view_name']
     }
     
+    # ALIASES flattened to alias -> canonical level, so normalizing is one lookup per parameter
+    _ALIAS_TO_LEVEL = {alias: level for level, aliases in ALIASES.items() for alias in aliases}
+    
     # Hierarchy levels in order (highest to lowest)
     HIERARCHY_LEVELS = ['catalog', 'database', 'schema', 'table', 'view']
     
@@ -61,6 +64,24 @@ class DBTable:
         {'table', 'view'}  # table and view are at the same level
     ]
     
+    # Fixed set of attributes: no per-instance __dict__, and attribute reads are slot loads
+    __slots__ = (
+        'catalog', 'database', 'schema', 'table', 'view',
+        '_normalized_params', '_rendered', '_repr', '_composite_schema',
+    )
+    
+    # All name rules in one precompiled pattern: starts with a letter, then only
+    # letters, numbers, underscores and dashes, 60 characters at most
+    _IDENT_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9_-]{0,59}\Z')
+    
+    # ORM classes built by to_orm, per engine: engine -> {(schema, name, class name): class}.
+    # Weakly keyed so a disposed engine takes its classes with it; see clear_orm_cache.
+    _orm_cache: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+    
+    # Reflected tables, per engine: engine -> MetaData. Shared by every to_orm call on
+    # that engine, so a table is reflected once even when several classes map it.
+    _metadata_cache: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+    
     def __init__(self, **kwargs):
         """
         Initialize DBTable with named parameters only.
@@ -83,9 +104,16 @@ class DBTable:
         # Normalize parameters using aliases
         self._normalized_params = self._normalize_parameters(kwargs)
         
-        # Validate all parameter names
+        # Validate all parameter names. Valid names pass with a single match;
+        # only invalid ones go through _validate_name for a specific error.
+        match = self._IDENT_RE.match
         for level, name in self._normalized_params.items():
-            self._validate_name(name, level)
+            # Most names are plain ASCII identifiers, which these C-level str
+            # checks accept faster than the regex; names with dashes fall through
+            if name.isidentifier() and name.isascii() and name[0] != '_' and len(name) <= 60:
+                continue
+            if match(name) is None:
+                self._validate_name(name, level)
         
         # Validate hierarchy requirements
         self._validate_hierarchy()
@@ -96,6 +124,68 @@ class DBTable:
         self.schema = self._normalized_params.get('schema')
         self.table = self._normalized_params.get('table')
         self.view = self._normalized_params.get('view')
+        
+        # DBTable is effectively immutable after construction, so render the
+        # SQL identifier and debug repr once instead of on every f-string use
+        self._render()
+    
+    @classmethod
+    def _from_validated(cls, params: Dict[str, str]) -> 'DBTable':
+        """
+        Build a DBTable from canonical parameters that are already known to be valid.
+        
+        Skips alias normalization and name/hierarchy validation; used by make_child,
+        whose parent has already been validated.
+        
+        Args:
+            params: Canonical level -> name mapping
+            
+        Returns:
+            New DBTable instance
+        """
+        obj = cls.__new__(cls)
+        obj._normalized_params = params
+        obj.catalog = params.get('catalog')
+        obj.database = params.get('database')
+        obj.schema = params.get('schema')
+        obj.table = params.get('table')
+        obj.view = params.get('view')
+        obj._render()
+        return obj
+    
+    def _render(self) -> None:
+        """Build and cache the fully qualified name and the repr string."""
+        parts = []
+        params = []
+        
+        # Build parts in hierarchy order
+        for level in self.HIERARCHY_LEVELS:
+            value = getattr(self, level)
+            if value is not None:
+                parts.append(value)
+                params.append(f"{level}='{value}'")
+        
+        self._rendered = '.'.join(parts)
+        self._repr = f"DBTable({', '.join(params)})"
+    
+    def _build_composite_schema(self) -> Optional[str]:
+        """
+        Build the SQLAlchemy schema to_orm reflects from: the levels above the
+        table/view, highest first, joined with dots.
+        
+        Returns:
+            Dotted schema string, or None if only a table/view is set
+        """
+        namespace_parts = []
+        if self.catalog:
+            namespace_parts.append(self.catalog)
+        if self.database:
+            namespace_parts.append(self.database)
+        if self.schema:
+            # Avoid duplicates if schema already included as database
+            if self.schema not in namespace_parts:
+                namespace_parts.append(self.schema)
+        return ".".join(namespace_parts) if namespace_parts else None
     
     def _normalize_parameters(self, kwargs: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -111,16 +201,11 @@ class DBTable:
             DBTableValidationError: If unknown parameters are provided
         """
         normalized = {}
-        used_aliases = set()
+        alias_to_level = self._ALIAS_TO_LEVEL
         
         for param_name, value in kwargs.items():
             # Find which canonical level this parameter belongs to
-            canonical_level = None
-            for level, aliases in self.ALIASES.items():
-                if param_name in aliases:
-                    canonical_level = level
-                    break
-            
+            canonical_level = alias_to_level.get(param_name)
             if canonical_level is None:
                 raise DBTableValidationError(f"Unknown parameter: {param_name}")
             
@@ -132,7 +217,6 @@ class DBTable:
                 )
             
             normalized[canonical_level] = str(value)
-            used_aliases.add(param_name)
         
         return normalized
     
@@ -147,6 +231,9 @@ class DBTable:
         Raises:
             DBTableValidationError: If name is invalid
         """
+        if self._IDENT_RE.match(name) is not None:
+            return
+        
         if not name:
             raise DBTableValidationError(f"{level} name cannot be empty")
         
@@ -162,11 +249,10 @@ class DBTable:
             )
         
         # Only letters, numbers, underscores, and dashes allowed
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', name):
-            raise DBTableValidationError(
-                f"{level} name '{name}' contains invalid characters. "
-                "Only letters, numbers, underscores, and dashes are allowed"
-            )
+        raise DBTableValidationError(
+            f"{level} name '{name}' contains invalid characters. "
+            "Only letters, numbers, underscores, and dashes are allowed"
+        )
     
     def _validate_hierarchy(self) -> None:
         """
@@ -199,15 +285,18 @@ class DBTable:
         Returns:
             String in format like "catalog.database.schema.table"
         """
-        parts = []
-        
-        # Build parts in hierarchy order
-        for level in self.HIERARCHY_LEVELS:
-            value = getattr(self, level)
-            if value is not None:
-                parts.append(value)
+        return self._rendered
+    
+    def __format__(self, format_spec: str) -> str:
+        """
+        Format the fully qualified table name (used by f-strings and str.format).
         
-        return '.'.join(parts)
+        Returns:
+            The cached qualified name, formatted with format_spec
+        """
+        if not format_spec:
+            return self._rendered
+        return format(self._rendered, format_spec)
     
     def __repr__(self) -> str:
         """
@@ -216,13 +305,7 @@ class DBTable:
         Returns:
             String showing the class and all non-None parameters
         """
-        params = []
-        for level in self.HIERARCHY_LEVELS:
-            value = getattr(self, level)
-            if value is not None:
-                params.append(f"{level}='{value}'")
-        
-        return f"DBTable({', '.join(params)})"
+        return self._repr
     
     def make_child(self, suffix: str) -> 'DBTable':
         """
@@ -253,26 +336,18 @@ class DBTable:
         else:
             raise DBTableValidationError("Cannot create child: no table or view name defined")
         
-        # Create new name
+        # Create new name. The base name and suffix are both valid, so only the
+        # combined length can be wrong; this reports it with the usual message.
         new_name = f"{base_name}_{suffix}"
+        if len(new_name) > 60:
+            self._validate_name(new_name, name_type)
         
-        # Build parameters for new instance
-        new_params = {}
-        for level in self.HIERARCHY_LEVELS:
-            value = getattr(self, level)
-            if value is not None:
-                if level == name_type:
-                    # Use canonical parameter name
-                    new_params[level] = new_name
-                else:
-                    new_params[level] = value
-        
-        is_debug = False
-        if(is_debug):
-            print("DBTable: Making Child with params of")
-            pprint(new_params)
-
-        return DBTable(**new_params)
+        # Same parameters as the parent, with the one name replaced
+        new_params = dict(self._normalized_params)
+        new_params[name_type] = new_name
+        
+        # The parent's names were validated when it was built
+        return DBTable._from_validated(new_params)
     
     def create_child(self, suffix: str) -> 'DBTable':
         """
@@ -286,13 +361,22 @@ class DBTable:
         """
         return self.make_child(suffix)
     
-    def to_orm(self, engine, python_class_name: Optional[str] = None):
+    def to_orm(self, engine, python_class_name: Optional[str] = None, *, metadata: Optional[MetaData] = None):
         """
         Convert this DBTable to a SQLAlchemy ORM class using reflection.
         
+        The generated class is cached per engine, so asking again for the same
+        table (for example from an equal DBTable built by make_child) does not
+        reflect it a second time. Reflected tables are kept in one MetaData per
+        engine, so a new class name for an already reflected table needs no queries.
+        
         Args:
             engine: SQLAlchemy engine connected to the database
             python_class_name: Optional override for the generated class name
+            metadata: Optional MetaData to take the table from instead of the
+                     per-engine one, e.g. after one bulk
+                     ``metadata.reflect(bind=engine, schema=...)`` call.
+                     Tables missing from it are reflected into it.
             
         Returns:
             SQLAlchemy ORM class mapped to the table
@@ -308,23 +392,37 @@ class DBTable:
         else:
             raise DBTableValidationError("Cannot create ORM: no table or view name defined")
         
-        # Build namespace parts for SQLAlchemy schema parameter
-        namespace_parts = []
+        # Built on first use only, since most DBTables never reach to_orm
+        try:
+            composite_schema = self._composite_schema
+        except AttributeError:
+            composite_schema = self._composite_schema = self._build_composite_schema()
         
-        # Add parts in hierarchy order (highest to lowest, excluding table/view)
-        if self.catalog:
-            namespace_parts.append(self.catalog)
-        if self.database:
-            namespace_parts.append(self.database)
-        if self.schema:
-            # Avoid duplicates if schema already included as database
-            if self.schema not in namespace_parts:
-                namespace_parts.append(self.schema)
-        
-        composite_schema = ".".join(namespace_parts) if namespace_parts else None
+        # Generate class name
+        default_class_name = f"{table_name.title().replace('_', '').replace('-', '')}Model"
+        orm_class_name = python_class_name or default_class_name
         
-        # Reflect the table
-        metadata_obj = MetaData()
+        # Reuse the class if this table was already reflected on this engine
+        try:
+            engine_cache = DBTable._orm_cache.setdefault(engine, {})
+        except TypeError:
+            # Engine-like objects that cannot be weakly referenced are not cached
+            engine_cache = {}
+        cache_key = (composite_schema, table_name, orm_class_name)
+        orm_class = engine_cache.get(cache_key)
+        if orm_class is not None:
+            return orm_class
+        
+        # Reflect the table, unless this MetaData already holds it
+        if metadata is not None:
+            metadata_obj = metadata
+        else:
+            try:
+                metadata_obj = DBTable._metadata_cache.get(engine)
+                if metadata_obj is None:
+                    metadata_obj = DBTable._metadata_cache[engine] = MetaData()
+            except TypeError:
+                metadata_obj = MetaData()
         reflected_table = Table(
             table_name,
             metadata_obj,
@@ -332,15 +430,35 @@ class DBTable:
             schema=composite_schema
         )
         
-        # Generate class name
-        default_class_name = f"{table_name.title().replace('_', '').replace('-', '')}Model"
-        orm_class_name = python_class_name or default_class_name
-        
         # Create ORM class
         orm_class = type(
             orm_class_name,
             (DeclarativeBase,),
             {"__table__": reflected_table}
         )
+        engine_cache[cache_key] = orm_class
         
         return orm_class
+    
+    @staticmethod
+    def clear_orm_cache(engine=None) -> None:
+        """
+        Forget the ORM classes and reflected tables cached by to_orm.
+        
+        Call this after changing a table's columns (e.g. DROP and CREATE it
+        again), so the next to_orm reflects the new definition instead of
+        returning the class built for the old one.
+        
+        Args:
+            engine: Only forget what was cached for this engine. Defaults to
+                   None, which clears the cache for every engine.
+        """
+        if engine is None:
+            DBTable._orm_cache.clear()
+            DBTable._metadata_cache.clear()
+            return
+        try:
+            DBTable._orm_cache.pop(engine, None)
+            DBTable._metadata_cache.pop(engine, None)
+        except TypeError:
+            pass  # Engine-like objects that cannot be weakly referenced are never cached
@@ -6,9 +6,15 @@ dict for reads but prevents accidental re-assignment of top-level keys.
 Emphasis on immutability, clarity, and crash-fast behavior.
 """
 
-from typing import Any, Dict, Iterator, KeysView, ItemsView, Union, Optional
-from collections.abc import Mapping
-import inspect
+from typing import Any, Dict, Union, Optional
+import linecache
+import sys
+
+# ANSI color codes for FrozenKeyError's friendly display
+_ANSI_RED = '\033[91m'
+_ANSI_YELLOW = '\033[93m'
+_ANSI_RESET = '\033[0m'
+_ANSI_BOLD = '\033[1m'
 
 
 class FrozenKeyError(Exception):
@@ -19,7 +25,10 @@ class FrozenKeyError(Exception):
     
     def __init__(self, key: Any, message: Optional[str] = None):
         self.key = key
+        # The stack only exists now, so locate the caller eagerly (a short frame walk);
+        # the display that reads the source file is built on first use
         self.caller_info = self._find_caller_location()
+        self._friendly_display: Optional[str] = None
         
         if message is None:
             message = f"Cannot reassign existing key '{key}' in FrostDict"
@@ -29,39 +38,39 @@ class FrozenKeyError(Exception):
     def _find_caller_location(self):
         """Find the location in user code where the duplicate key was used."""
         try:
-            # Get the current stack
-            stack = inspect.stack()
-            
-            # Look for the frame that's not in frostdict.py
-            for frame_info in stack:
-                filename = frame_info.filename
-                if not filename.endswith('frostdict.py'):
-                    return {
-                        'filename': filename,
-                        'lineno': frame_info.lineno,
-                        'function': frame_info.function
-                    }
+            # Walk back frame by frame (no FrameInfo objects or source reads, unlike
+            # inspect.stack()) to the first frame that's not in this file
+            frame = sys._getframe(1)
+            while frame is not None and frame.f_code.co_filename == __file__:
+                frame = frame.f_back
             
-            return None
+            if frame is None:
+                return None
+            return {
+                'filename': frame.f_code.co_filename,
+                'lineno': frame.f_lineno,
+                'function': frame.f_code.co_name
+            }
         except Exception:
             # If we can't determine the caller location, return None
             return None
     
     def get_friendly_error_display(self):
-        """Create a friendly, IDE-like error display."""
-        # ANSI color codes
-        RED = '\033[91m'
-        YELLOW = '\033[93m'
-        RESET = '\033[0m'
-        BOLD = '\033[1m'
-        
-        lines = []
-        
-        # Error header with red X
-        lines.append(f"{RED}❌ FrostDict Key Conflict{RESET}")
+        """Create a friendly, IDE-like error display (built once, then reused)."""
+        if self._friendly_display is None:
+            self._friendly_display = self._build_friendly_error_display()
+        return self._friendly_display
+    
+    def _build_friendly_error_display(self):
+        """Render the display for get_friendly_error_display."""
+        RED, YELLOW, RESET, BOLD = _ANSI_RED, _ANSI_YELLOW, _ANSI_RESET, _ANSI_BOLD
         
-        # Key information
-        lines.append(f"Attempted to reassign existing key: {BOLD}'{self.key}'{RESET}")
+        lines = [
+            # Error header with red X
+            f"{RED}❌ FrostDict Key Conflict{RESET}",
+            # Key information
+            f"Attempted to reassign existing key: {BOLD}'{self.key}'{RESET}",
+        ]
         
         if self.caller_info:
             # File location in yellow
@@ -72,10 +81,12 @@ class FrozenKeyError(Exception):
             lines.append(f"{YELLOW}📁 {filename}{RESET}")
             lines.append("")  # Empty line for spacing
             
-            # Try to read and display the file context
+            # Try to read and display the file context (linecache keeps the file's
+            # lines across errors, exactly as tracebacks do)
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    file_lines = f.readlines()
+                file_lines = linecache.getlines(filename)
+                if not file_lines:
+                    raise IOError(filename)
                 
                 # Calculate the range of lines to show (5 before, problem line, 5 after)
                 start_line = max(1, lineno - 5)
@@ -83,15 +94,12 @@ class FrozenKeyError(Exception):
                 
                 lines.append("Code context:")
                 
-                for i in range(start_line, end_line + 1):
-                    line_content = file_lines[i - 1].rstrip()  # Remove trailing whitespace
-                    line_num_str = f"{i:4d}"
-                    
-                    if i == lineno:
-                        # Highlight the problematic line in red
-                        lines.append(f"{RED}{line_num_str} | {line_content}{RESET}")
-                    else:
-                        lines.append(f"{line_num_str} | {line_content}")
+                # Highlight the problematic line in red; trailing whitespace is removed
+                lines.extend(
+                    f"{RED}{i:4d} | {file_lines[i - 1].rstrip()}{RESET}" if i == lineno
+                    else f"{i:4d} | {file_lines[i - 1].rstrip()}"
+                    for i in range(start_line, end_line + 1)
+                )
                 
             except (IOError, IndexError):
                 lines.append(f"Could not read file context from {filename}:{lineno}")
@@ -102,13 +110,15 @@ class FrozenKeyError(Exception):
         return "\n".join(lines)
 
 
-class FrostDict(Mapping[str, Any]):
+class FrostDict(dict):
     """
     A frozen dictionary that prevents re-assignment of existing top-level keys.
     
-    Feels like a normal dict for reads, but raises FrozenKeyError on attempts
-    to update existing top-level keys. New keys can be added, and nested values
-    remain mutable.
+    FrostDict is a dict subclass, so reads (``fd[key]``, ``in``, iteration,
+    ``keys()``, ``items()``, ``get()``) run as native dict operations. Only the
+    write paths are overridden: re-assigning an existing top-level key raises
+    FrozenKeyError and removing keys is not supported. New keys can be added,
+    and nested values remain mutable.
     
     Examples:
         >>> fd = FrostDict({'key1': 'value1'})
@@ -123,6 +133,9 @@ class FrostDict(Mapping[str, Any]):
         >>> fd['config']['setting'] = 'new_value'  # This works fine
     """
     
+    # Cached hash; cleared whenever a new key is added
+    __slots__ = ("_hash",)
+    
     def __init__(self, initial_data: Union[Dict[str, Any], None] = None):
         """
         Initialize a FrostDict with optional initial data.
@@ -130,82 +143,82 @@ class FrostDict(Mapping[str, Any]):
         Args:
             initial_data: Optional dictionary to initialize with.
         """
-        self._data: Dict[str, Any] = {}
-        if initial_data is not None:
-            self._data.update(initial_data)
-    
-    def __getitem__(self, key: str) -> Any:
-        """Get an item by key."""
-        return self._data[key]
+        self._hash: Optional[int] = None
+        if initial_data is None:
+            super().__init__()
+        else:
+            super().__init__(initial_data)
     
     def __setitem__(self, key: str, value: Any) -> None:
         """
         Set an item by key.
         
-        Prints friendly error message and exits if the key already exists.
+        Raises FrozenKeyError if the key already exists. Its IDE-like display
+        (source context of the offending line) is built only when a caller asks
+        for it with get_friendly_error_display().
         """
-        if key in self._data:
-            # Create the enhanced error with friendly display
-            error = FrozenKeyError(key)
-            # Print the beautiful, IDE-like error display
-            print(error.get_friendly_error_display())
-            import sys
-            sys.exit(1)
-        self._data[key] = value
-    
-    def __contains__(self, key: str) -> bool:
-        """Check if key exists in the dictionary."""
-        return key in self._data
-    
-    def __iter__(self) -> Iterator[str]:
-        """Iterate over keys."""
-        return iter(self._data)
-    
-    def __len__(self) -> int:
-        """Return the number of items."""
-        return len(self._data)
+        # setdefault looks the key up and inserts it in one probe. It never
+        # overwrites, so an unchanged length means the key was already there.
+        size = len(self)
+        dict.setdefault(self, key, value)
+        if len(self) == size:
+            raise FrozenKeyError(key)
+        self._hash = None
+    
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return fd[key], adding it with default first if missing (no re-assignment happens)."""
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Add items from a mapping/iterable and keyword arguments, one key at a time."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def __ior__(self, other: Any) -> "FrostDict":
+        """Support ``fd |= other`` with the same frozen-key checks as update()."""
+        self.update(other)
+        return self
+    
+    def _refuse_removal(self, *args: Any, **kwargs: Any) -> None:
+        """Removing keys would allow a later re-assignment, so it is not supported."""
+        raise TypeError("FrostDict does not support removing keys")
+    
+    __delitem__ = _refuse_removal
+    pop = _refuse_removal
+    popitem = _refuse_removal
+    clear = _refuse_removal
+    
+    def __reduce__(self):
+        """Pickle through __init__ so the hash slot is always initialized."""
+        return (FrostDict, (dict(self),))
+    
+    def copy(self) -> "FrostDict":
+        """Return a shallow copy that is also a FrostDict."""
+        return FrostDict(self)
     
     def __repr__(self) -> str:
         """Return a clear, one-line representation for debugging."""
-        return f"FrostDict({self._data!r})"
+        return f"FrostDict({dict.__repr__(self)})"
     
     def __str__(self) -> str:
         """Return string representation."""
         return self.__repr__()
     
-    def __eq__(self, other: object) -> bool:
-        """Check equality with another FrostDict or dict."""
-        if isinstance(other, FrostDict):
-            return self._data == other._data
-        elif isinstance(other, dict):
-            return self._data == other
-        return False
-    
     def __hash__(self) -> int:
         """
         Return hash if all contained values are hashable.
         
+        The hash is computed once and cached until a new key is added.
         Raises TypeError if any value is not hashable.
         """
-        try:
-            # Create a tuple of sorted key-value pairs for consistent hashing
-            items = tuple(sorted(self._data.items()))
-            return hash(items)
-        except TypeError as e:
-            raise TypeError(f"FrostDict is not hashable because it contains unhashable values: {e}")
-    
-    def keys(self) -> KeysView[str]:
-        """Return a view of the dictionary's keys."""
-        return self._data.keys()
-    
-    def items(self) -> ItemsView[str, Any]:
-        """Return a view of the dictionary's items."""
-        return self._data.items()
-    
-    def values(self):
-        """Return a view of the dictionary's values."""
-        return self._data.values()
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get a value by key with optional default."""
-        return self._data.get(key, default)
+        h = self._hash
+        if h is None:
+            try:
+                # Order-independent hash of the key-value pairs, without sorting them
+                h = hash(frozenset(self.items()))
+            except TypeError as e:
+                raise TypeError(f"FrostDict is not hashable because it contains unhashable values: {e}")
+            self._hash = h
+        return h
@@ -7,48 +7,126 @@ Single-file child classes with zero GX boilerplate.
 
 import sys
 import os
+import hashlib
 import importlib.util
+import threading
 import warnings
+import weakref
 from abc import ABC, abstractmethod
-from typing import Union, List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from types import ModuleType
+from typing import Union, List, Dict, Any, Optional, Tuple
 import sqlalchemy
 import pandas as pd
 
-try:
-    import great_expectations as gx
-except ImportError:
-    raise ImportError(
-        "Great Expectations is required for InLaw. Install with: pip install great-expectations"
-    )
+# Short names accepted in a declarative test's `expect` tuple:
+# name -> (GX validator method, names of the arguments that follow the column)
+_EXPECTATIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "between": ("expect_column_values_to_be_between", ("min_value", "max_value")),
+    "not_null": ("expect_column_values_to_not_be_null", ()),
+    "null": ("expect_column_values_to_be_null", ()),
+    "unique": ("expect_column_values_to_be_unique", ()),
+    "in_set": ("expect_column_values_to_be_in_set", ("value_set",)),
+    "match_regex": ("expect_column_values_to_match_regex", ("regex",)),
+    "min_between": ("expect_column_min_to_be_between", ("min_value", "max_value")),
+    "max_between": ("expect_column_max_to_be_between", ("min_value", "max_value")),
+    "mean_between": ("expect_column_mean_to_be_between", ("min_value", "max_value")),
+    "sum_between": ("expect_column_sum_to_be_between", ("min_value", "max_value")),
+}
 
-# Suppress Great Expectations checkpoint warnings since InLaw replaces checkpoints
-warnings.filterwarnings(
-    "ignore",
-    message=r".*result_format.*configured at the Validator-level will not be persisted.*",
-    category=UserWarning,
-    module="great_expectations.expectations.expectation"
-)
+# text() constructs for recently used SQL strings, so repeat runs of the same test
+# query reuse one TextClause (and with it SQLAlchemy's compiled-statement cache key)
+_sql_text = lru_cache(maxsize=256)(sqlalchemy.text)
 
+# Connection and query results shared by every test during a run_all call
+# (see InLaw._connect and InLaw._read_sql)
+_run_state = threading.local()
 
-class _SuppressGXWarnings:
-    """Context manager to suppress Great Expectations checkpoint warnings."""
+# GX context, built once per thread for the run_all call in progress (see InLaw._gx_asset)
+_gx_state = threading.local()
+_GX_ASSETS_PER_CONTEXT = 256
+
+# GX serializes its config through one module-level YAML writer that is not
+# thread-safe, so building contexts and validators is done one thread at a time
+_gx_build_lock = threading.Lock()
+
+# ANSI color codes for run_all's report; the PASS line never changes, so it is built once
+_ANSI_GREEN = "\033[92m"
+_ANSI_RED = "\033[91m"
+_ANSI_RESET = "\033[0m"
+_PASS_LINE = _ANSI_GREEN + "✅ PASS" + _ANSI_RESET
+
+# great_expectations module, imported on first use (see _require_gx)
+_gx: Optional[ModuleType] = None
+_gx_lock = threading.Lock()
+
+
+def _require_gx() -> ModuleType:
+    """
+    Import Great Expectations on first use and return the module.
     
-    def __enter__(self):
-        warnings.filterwarnings(
-            "ignore",
-            message=r".*result_format.*configured at the Validator-level will not be persisted.*",
-            category=UserWarning
-        )
-        return self
+    GX and its dependencies take seconds to import, so this is deferred until a
+    test actually needs a validator. Code that only uses DBTable, FrostDict,
+    SQLoopcicle or the SQL-only InLaw helpers never pays for it.
+    
+    Returns:
+        The great_expectations module
+        
+    Raises:
+        ImportError: If Great Expectations is not installed
+    """
+    global _gx
+    if _gx is not None:
+        return _gx
+    
+    with _gx_lock:
+        if _gx is None:
+            # Suppress Marshmallow warnings before importing Great Expectations
+            # These are version compatibility issues between Great Expectations and Marshmallow
+            # that will be resolved in future GX releases
+            try:
+                from marshmallow.warnings import ChangedInMarshmallow4Warning
+                warnings.filterwarnings(
+                    "ignore",
+                    message=r".*Number.*field should not be instantiated.*Use.*Integer.*Float.*or.*Decimal.*instead.*",
+                    category=ChangedInMarshmallow4Warning
+                )
+            except ImportError:
+                # Fallback if marshmallow warnings module structure changes
+                warnings.filterwarnings(
+                    "ignore",
+                    message=r".*Number.*field should not be instantiated.*Use.*Integer.*Float.*or.*Decimal.*instead.*"
+                )
+            
+            try:
+                import great_expectations as gx
+            except ImportError:
+                raise ImportError(
+                    "Great Expectations is required for InLaw. Install with: pip install great-expectations"
+                )
+            _gx = gx
+    return _gx
+
+
+
+@contextmanager
+def _quiet_gx_checkpoint_warning():
+    """
+    Suppress GX's Validator-level result_format warning inside the block.
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # Reset warnings to default behavior for this specific warning
+    InLaw replaces checkpoints, so the warning does not apply. GX emits it
+    when an expectation runs, so the filter is scoped to those calls rather
+    than installed process-wide, where test runners would reset it anyway.
+    """
+    with warnings.catch_warnings():
         warnings.filterwarnings(
-            "default",
-            message=r".*result_format.*configured at the Validator-level will not be persisted.*",
+            "ignore",
+            message=r".*result_format.*configured at the Validator-level will not be persisted",
             category=UserWarning
         )
-
+        yield
 
 class InLaw(ABC):
     """
@@ -57,10 +135,44 @@ class InLaw(ABC):
     Child classes must implement:
     - title: str (class attribute)
     - run(engine) -> bool | str (static method)
+    
+    Or, for single-value checks, declare instead:
+    - probe_sql: str (class attribute) - query returning one row with one column
+    - check(value) -> bool | str (static method)
+    
+    Or, for a single GX expectation, declare only class attributes:
+    - sql: str - query to validate
+    - expect: tuple - e.g. ("between", "column_name", 7, 10)
+    - fail_msg: str (optional) - message reported when the expectation fails
+    
+    Probe-style tests are fused into a single SELECT by run_all, so N checks
+    cost one database round-trip instead of N.
     """
     
     title: str = "Unnamed Test"
     
+    # Scalar query for probe-style tests; None means the test uses run()
+    probe_sql: Optional[str] = None
+    
+    # Declarative tests: a query, one GX expectation as (name, column, *args)
+    # using the short names in _EXPECTATIONS, and the message to report on failure
+    sql: Optional[str] = None
+    expect: Optional[Tuple[Any, ...]] = None
+    fail_msg: Optional[str] = None
+    
+    # Imported test modules keyed by absolute path -> (mtime, module), so repeat
+    # run_all calls don't re-execute unchanged files
+    _module_cache: Dict[str, Tuple[float, ModuleType]] = {}
+    
+    # Every subclass (at any depth) in definition order, filled by __init_subclass__.
+    # Weak references, like type.__subclasses__(), so discarded classes can be collected.
+    _registry: List["weakref.ReferenceType[type]"] = []
+    
+    def __init_subclass__(cls, **kwargs):
+        """Register each new test class as it is defined."""
+        super().__init_subclass__(**kwargs)
+        InLaw._registry.append(weakref.ref(cls))
+    
     @staticmethod
     @abstractmethod
     def run(engine) -> Union[bool, str]:
@@ -76,7 +188,176 @@ class InLaw(ABC):
         """
         pass
     
+    @staticmethod
+    def check(value) -> Union[bool, str]:
+        """
+        Check the value returned by probe_sql.
         
+        Args:
+            value: The single value returned by the probe_sql query
+            
+        Returns:
+            True if test passes
+            str if test fails (error message)
+        """
+        raise NotImplementedError("InLaw tests that set probe_sql must implement check(value)")
+    
+    @staticmethod
+    @contextmanager
+    def _connect(engine):
+        """
+        Yield a connection for engine, reusing the one held open by run_all.
+        
+        Args:
+            engine: SQLAlchemy engine or an already open Connection
+            
+        Yields:
+            SQLAlchemy Connection
+        """
+        if isinstance(engine, sqlalchemy.engine.Connection):
+            yield engine
+            return
+        
+        shared = getattr(_run_state, "connection", None)
+        if shared is not None and shared.engine is engine:
+            try:
+                yield shared
+            except Exception:
+                # Clear any failed transaction so the next test can use the connection
+                shared.rollback()
+                raise
+            return
+        
+        with engine.connect() as conn:
+            yield conn
+    
+    @staticmethod
+    @contextmanager
+    def _shared_connection(engine):
+        """
+        Hold one connection open so every test in a run_all call reuses it.
+        
+        Args:
+            engine: SQLAlchemy engine for database connection
+        """
+        try:
+            conn = engine.connect()
+        except Exception:
+            # Let each test report the connection problem itself
+            yield
+            return
+        
+        _run_state.connection = conn
+        try:
+            yield
+        finally:
+            _run_state.connection = None
+            conn.close()
+        
+    @staticmethod
+    @contextmanager
+    def _query_cache():
+        """
+        Cache SELECT results for the duration of a run_all call.
+        
+        Tests that issue the same SQL share one DataFrame instead of each
+        querying the database, so tests must not rely on data changing
+        mid-run. The cache is dropped when the block exits.
+        """
+        _run_state.query_cache = {}
+        try:
+            yield
+        finally:
+            _run_state.query_cache = None
+    
+    @staticmethod
+    def _fetch_df(*, sql: str, engine) -> pd.DataFrame:
+        """
+        Run sql and return its result as one pandas DataFrame.
+        
+        The result is read in a single pass, so column dtypes are inferred from
+        every row rather than chunk by chunk.
+        
+        Args:
+            sql: SQL query string
+            engine: SQLAlchemy engine or Connection
+            
+        Returns:
+            pandas DataFrame with the query result
+        """
+        with InLaw._connect(engine) as conn:
+            return pd.read_sql_query(_sql_text(sql), conn)
+    
+    @staticmethod
+    def _read_sql(*, sql: str, engine) -> pd.DataFrame:
+        """
+        Run sql and return a pandas DataFrame, reusing run_all's cached result if any.
+        
+        Args:
+            sql: SQL query string
+            engine: SQLAlchemy engine or Connection
+            
+        Returns:
+            pandas DataFrame with the query result
+        """
+        cache = getattr(_run_state, "query_cache", None)
+        if cache is None:
+            return InLaw._fetch_df(sql=sql, engine=engine)
+        
+        # Whitespace-insensitive but not case-insensitive: string literals matter
+        key = (id(engine), " ".join(sql.split()))
+        pandas_df = cache.get(key)
+        if pandas_df is None:
+            pandas_df = InLaw._fetch_df(sql=sql, engine=engine)
+            cache[key] = pandas_df
+        # Hand out a shallow copy so columns added by one test do not leak into another
+        return pandas_df.copy(deep=False)
+    
+    @staticmethod
+    @contextmanager
+    def _gx_scope():
+        """
+        Share GX contexts between the tests of one run_all call.
+        
+        A context carries state (datasources, logging) that must not leak into
+        later runs, so the contexts built during the block are dropped when it exits.
+        """
+        _run_state.gx_run = object()
+        try:
+            yield
+        finally:
+            _run_state.gx_run = None
+            _gx_state.context = _gx_state.run = None
+    
+    @staticmethod
+    def _gx_asset():
+        """
+        Return the GX context and a new pandas dataframe asset.
+        
+        Building a context is the most expensive step, so during a run_all call it
+        is made once per thread; outside run_all every call gets a fresh context.
+        Each call still registers its own datasource: validators from one
+        datasource share an execution engine, so a second DataFrame would replace
+        the first one under a validator that is still in use. The context is
+        rebuilt every _GX_ASSETS_PER_CONTEXT calls so datasources do not pile up.
+        
+        Returns:
+            Tuple of (GX data context, pandas dataframe asset)
+        """
+        run = getattr(_run_state, "gx_run", None)
+        if run is None:
+            context, count = _require_gx().get_context(), 0
+        else:
+            count = getattr(_gx_state, "count", 0)
+            if getattr(_gx_state, "run", None) is not run or count >= _GX_ASSETS_PER_CONTEXT:
+                _gx_state.context = _require_gx().get_context()
+                _gx_state.run = run
+                count = 0
+            _gx_state.count = count + 1
+            context = _gx_state.context
+        datasource = context.sources.add_pandas(f"pandas_datasource_{count}")
+        return context, datasource.add_dataframe_asset("dataframe_asset")
+    
     @staticmethod
     def sql_to_gx_df(*, sql: str, engine):
         """
@@ -89,23 +370,15 @@ class InLaw(ABC):
         Returns:
             Great Expectations DataFrame
         """
+        # Outside the try below so a missing GX install is reported as such
+        _require_gx()
         try:
-            # Execute SQL and get pandas DataFrame
-            with engine.connect() as conn:
-                pandas_df = pd.read_sql_query(sqlalchemy.text(sql), conn)
+            # Execute SQL (or reuse this run's result for the same SQL) and get pandas DataFrame
+            pandas_df = InLaw._read_sql(sql=sql, engine=engine)
             
-            # Suppress only the specific result_format warning during GX operations
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r".*result_format.*configured at the Validator-level will not be persisted.*",
-                    category=UserWarning
-                )
-                
-                # Convert to Great Expectations DataFrame using the correct API
-                context = gx.get_context()
-                datasource = context.sources.add_pandas("pandas_datasource")
-                data_asset = datasource.add_dataframe_asset("dataframe_asset")
+            # Convert to Great Expectations DataFrame using the correct API
+            with _gx_build_lock, _quiet_gx_checkpoint_warning():
+                context, data_asset = InLaw._gx_asset()
                 batch_request = data_asset.build_batch_request(dataframe=pandas_df)
                 gx_df = context.get_validator(batch_request=batch_request)
             
@@ -129,39 +402,174 @@ class InLaw(ABC):
         """
         return InLaw.sql_to_gx_df(sql=sql, engine=engine)
     
+    @staticmethod
+    def assert_zero_rows(*, sql: str, engine, fail_msg: Optional[str] = None) -> Union[bool, str]:
+        """
+        Check that a query returns no rows, counting them in the database.
+        
+        The query is wrapped in SELECT COUNT(*) so only the count comes back,
+        instead of pulling the offending rows into pandas to take len() of them.
+        
+        Args:
+            sql: Query selecting the rows that should not exist
+            engine: SQLAlchemy engine
+            fail_msg: Optional message to return when rows are found
+            
+        Returns:
+            True if the query returns no rows, otherwise the failure message
+        """
+        count_sql = f"SELECT COUNT(*) FROM ({sql.strip().rstrip(';')}) AS inlaw_rows"
+        with InLaw._connect(engine) as conn:
+            count = conn.execute(_sql_text(count_sql)).scalar()
+        if count == 0:
+            return True
+        return fail_msg or f"Expected zero rows, found {count}"
+    
+    @staticmethod
+    def scalar(*, sql: str, engine) -> Any:
+        """
+        Run a query that returns exactly one value and return it.
+        
+        For counts and other aggregates there is no need for pandas or Great
+        Expectations: the database computes the value and only it comes back.
+        
+        Args:
+            sql: Query returning one row with one column, e.g. SELECT COUNT(*) ...
+            engine: SQLAlchemy engine
+            
+        Returns:
+            The single value returned by the query
+            
+        Raises:
+            sqlalchemy.exc.NoResultFound, sqlalchemy.exc.MultipleResultsFound:
+                If the query does not return exactly one row
+        """
+        with InLaw._connect(engine) as conn:
+            return conn.execute(_sql_text(sql)).scalar_one()
+    
+    @staticmethod
+    def first_row(*, sql: str, engine) -> Dict[str, Any]:
+        """
+        Run a query that returns exactly one row and return it as a dictionary.
+        
+        Useful for checks that compare several aggregates computed together,
+        without building a DataFrame or a GX validator.
+        
+        Args:
+            sql: Query returning exactly one row
+            engine: SQLAlchemy engine
+            
+        Returns:
+            Dictionary mapping column name to value
+            
+        Raises:
+            sqlalchemy.exc.NoResultFound, sqlalchemy.exc.MultipleResultsFound:
+                If the query does not return exactly one row
+        """
+        with InLaw._connect(engine) as conn:
+            return dict(conn.execute(_sql_text(sql)).mappings().one())
+    
+    @staticmethod
+    def scalars(*, sql_dict: Dict[str, str], engine) -> Dict[str, Any]:
+        """
+        Run several single-value queries in one round-trip.
+        
+        Each query becomes a scalar subquery of one SELECT, so checking N counts
+        costs one trip to the database instead of N.
+        
+        Args:
+            sql_dict: Mapping of name to a query returning one row with one column
+            engine: SQLAlchemy engine
+            
+        Returns:
+            Dictionary mapping each name to its query's value
+        """
+        if not sql_dict:
+            return {}
+        queries = [sql.strip().rstrip(';') for sql in sql_dict.values()]
+        columns = ", ".join(f"({sql}) AS value_{i}" for i, sql in enumerate(queries))
+        with InLaw._connect(engine) as conn:
+            row = conn.execute(_sql_text(f"SELECT {columns}")).one()
+        return dict(zip(sql_dict, row))
+    
     @staticmethod
     def ansi_green(text: str) -> str:
         """Return text with ANSI green color codes."""
-        return f"\033[92m{text}\033[0m"
+        return _ANSI_GREEN + text + _ANSI_RESET
     
     @staticmethod
     def ansi_red(text: str) -> str:
         """Return text with ANSI red color codes."""
-        return f"\033[91m{text}\033[0m"
+        return _ANSI_RED + text + _ANSI_RESET
 
     @staticmethod
-    def _import_file(*, file_path: str) -> None:
+    def _load_inlaw_file(*, file_path: str, module_name: str) -> ModuleType:
+        """
+        Execute a test file into a fresh module namespace.
+        
+        The standard source loader is used, so compiled bytecode is cached in the
+        file's __pycache__ directory like any other import.
+        
+        Args:
+            file_path: Absolute path to the Python file
+            module_name: Name to give the module
+            
+        Returns:
+            The executed module
+        """
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    
+    @staticmethod
+    def _import_file(*, file_path: str) -> bool:
         """
         Import a Python file to discover InLaw subclasses.
         
+        Files that were already imported and have not changed on disk are not
+        executed again.
+        
         Args:
             file_path: Path to the Python file to import
+            
+        Returns:
+            True if the file was executed, False if a cached module was reused
         """
         try:
             # Get absolute path
             abs_path = os.path.abspath(file_path)
+            mtime = os.stat(abs_path).st_mtime
+            
+            # Reuse the module if this exact file version was already loaded
+            cached = InLaw._module_cache.get(abs_path)
+            if cached is not None and cached[0] == mtime:
+                return False
             
             # Create module name from file path
             module_name = os.path.splitext(os.path.basename(abs_path))[0]
             
-            # Load the module
-            spec = importlib.util.spec_from_file_location(module_name, abs_path)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+            # A regular import of the same file already registered its classes
+            modules = sys.modules
+            existing = modules.get(module_name)
+            if cached is None and existing is not None and getattr(existing, '__file__', None) == abs_path:
+                InLaw._module_cache[abs_path] = (mtime, existing)
+                return False
+            
+            # Load the module under a name unique to its path, so same-named files in
+            # different directories (suite_a/checks.py, suite_b/checks.py) do not
+            # collapse into one module when test classes are deduplicated
+            path_digest = hashlib.sha1(abs_path.encode()).hexdigest()[:12]
+            module = InLaw._load_inlaw_file(
+                file_path=abs_path, module_name=f"{module_name}_{path_digest}"
+            )
+            InLaw._module_cache[abs_path] = (mtime, module)
+            return True
                 
         except Exception as e:
             print(f"Warning: Failed to import {file_path}: {e}")
+        
+        return False
     
     @staticmethod
     def _import_directory(*, directory_path: str) -> None:
@@ -176,16 +584,184 @@ class InLaw(ABC):
                 print(f"Warning: Directory {directory_path} does not exist")
                 return
                 
-            for filename in os.listdir(directory_path):
-                if filename.endswith('.py') and not filename.startswith('__'):
-                    file_path = os.path.join(directory_path, filename)
-                    InLaw._import_file(file_path=file_path)
+            # scandir's entries know their type, so no extra stat per file;
+            # _import_file skips files that are already loaded and unchanged
+            with os.scandir(directory_path) as entries:
+                file_paths = [
+                    entry.path for entry in entries
+                    if entry.name.endswith('.py') and not entry.name.startswith('__') and entry.is_file()
+                ]
+            for file_path in file_paths:
+                InLaw._import_file(file_path=file_path)
                     
         except Exception as e:
             print(f"Warning: Failed to import from directory {directory_path}: {e}")
 
     @staticmethod
-    def run_all(*, engine, inlaw_files: Optional[List[str]] = None, inlaw_dir: Optional[str] = None) -> Dict[str, Any]:
+    def _dedupe_by_qualname(classes: List[type]) -> List[type]:
+        """
+        Collapse classes that share a module and qualified name.
+        
+        Re-importing a test file defines its classes again; the newest
+        definition replaces the old one but keeps its original position.
+        
+        Args:
+            classes: Test classes in definition order
+            
+        Returns:
+            List of test classes with one entry per module-qualified name
+        """
+        latest = {}
+        for test_class in classes:
+            latest[(test_class.__module__, test_class.__qualname__)] = test_class
+        return list(latest.values())
+
+    @staticmethod
+    def _discover_subclasses() -> List[type]:
+        """
+        Return every runnable InLaw subclass, including subclasses of subclasses.
+        
+        A class that defines none of run, probe_sql or expect (e.g. an
+        intermediate base that only shares helpers) is not a test and is skipped.
+        
+        Returns:
+            List of InLaw test classes in definition order
+        """
+        alive = [ref for ref in InLaw._registry if ref() is not None]
+        InLaw._registry[:] = alive
+        classes = [ref() for ref in alive]
+        return InLaw._dedupe_by_qualname([
+            test_class for test_class in classes
+            if test_class.run is not InLaw.run
+            or test_class.probe_sql is not None
+            or test_class.expect is not None
+        ])
+
+    @staticmethod
+    def _run_declarative(*, test_class: type, engine) -> Union[bool, str]:
+        """
+        Run a declarative test's single expectation against its sql.
+        
+        Args:
+            test_class: InLaw subclass that declares sql and expect
+            engine: SQLAlchemy engine for database connection
+            
+        Returns:
+            True if the expectation passes, otherwise the failure message
+            
+        Raises:
+            ValueError: If expect names an unknown expectation
+        """
+        name, column, *args = test_class.expect
+        try:
+            method_name, arg_names = _EXPECTATIONS[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown expectation '{name}'. Use one of: {', '.join(_EXPECTATIONS)}"
+            )
+        
+        gx_df = InLaw.sql_to_gx_df(sql=test_class.sql, engine=engine)
+        with _quiet_gx_checkpoint_warning():
+            result = getattr(gx_df, method_name)(column=column, **dict(zip(arg_names, args)))
+        
+        if result.success:
+            return True
+        return test_class.fail_msg or f"Expectation '{name}' failed for column {column}"
+
+    @staticmethod
+    def _run_probes(*, engine, test_classes: List[type]) -> Dict[type, Any]:
+        """
+        Run the probe_sql of every given test class in a single SELECT.
+        
+        If the fused query fails, each probe is run on its own so that a broken
+        probe only errors its own test.
+        
+        Args:
+            engine: SQLAlchemy engine for database connection
+            test_classes: InLaw subclasses that declare probe_sql
+            
+        Returns:
+            Dictionary mapping each test class to its probe value, or to the
+            exception raised while running its probe
+        """
+        if not test_classes:
+            return {}
+        
+        probes = [test_class.probe_sql.strip().rstrip(';') for test_class in test_classes]
+        
+        try:
+            return InLaw.scalars(sql_dict=dict(zip(test_classes, probes)), engine=engine)
+        except Exception:
+            pass
+        
+        values = {}
+        try:
+            with InLaw._connect(engine) as conn:
+                for test_class, probe in zip(test_classes, probes):
+                    try:
+                        values[test_class] = conn.execute(_sql_text(probe)).scalar()
+                    except Exception as e:
+                        conn.rollback()
+                        values[test_class] = e
+        except Exception as e:
+            # Could not connect at all: every remaining probe errors
+            for test_class in test_classes:
+                values.setdefault(test_class, e)
+        return values
+
+    @staticmethod
+    def _run_one(*, test_class: type, engine, probe_values: Dict[type, Any]) -> Union[bool, str]:
+        """
+        Run a single test class in whichever form it declares.
+        
+        Args:
+            test_class: InLaw subclass to run
+            engine: SQLAlchemy engine for database connection
+            probe_values: Results of _run_probes for probe-style tests
+            
+        Returns:
+            The test's result: True on success, otherwise a failure message
+        """
+        if test_class in probe_values:
+            value = probe_values[test_class]
+            if isinstance(value, Exception):
+                raise value
+            return test_class.check(value)
+        if test_class.expect is not None and test_class.sql is not None:
+            return InLaw._run_declarative(test_class=test_class, engine=engine)
+        # run() methods call GX expectations themselves
+        with _quiet_gx_checkpoint_warning():
+            return test_class.run(engine)
+
+    @staticmethod
+    def _is_parallel_safe(engine) -> bool:
+        """
+        Whether tests may use engine from several threads at once.
+        
+        An in-memory SQLite database exists per connection, so worker threads
+        would each see an empty database unless the engine uses StaticPool.
+        
+        Args:
+            engine: SQLAlchemy engine or Connection
+            
+        Returns:
+            True if run_all may run tests in parallel on this engine
+        """
+        if isinstance(engine, sqlalchemy.engine.Connection):
+            return False
+        url = engine.url
+        if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            return isinstance(engine.pool, sqlalchemy.pool.StaticPool)
+        return True
+
+    @staticmethod
+    def run_all(
+        *,
+        engine,
+        inlaw_files: Optional[List[str]] = None,
+        inlaw_dir: Optional[str] = None,
+        max_workers: Optional[int] = 1
+    ) -> Dict[str, Any]:
         """
         Discover and run all InLaw subclasses.
         
@@ -193,6 +769,10 @@ class InLaw(ABC):
             engine: SQLAlchemy engine for database connection
             inlaw_files: Optional list of relative file paths to import for InLaw tests
             inlaw_dir: Optional directory path to scan for InLaw test files
+            max_workers: Number of tests to run at once, each on its own pooled
+                        connection. Defaults to 1 (serial). None picks one worker per
+                        CPU core, leaving two cores free. Ignored for in-memory
+                        SQLite engines that are not on a StaticPool.
             
         Returns:
             Dictionary with test results summary
@@ -209,50 +789,94 @@ class InLaw(ABC):
             InLaw._import_directory(directory_path=inlaw_dir)
         
         # Discover all subclasses (including newly imported ones)
-        subclasses = InLaw.__subclasses__()
+        subclasses = InLaw._discover_subclasses()
         
         if not subclasses:
             print("No InLaw test classes found.")
             return {"passed": 0, "failed": 0, "errors": 0, "total": 0}
         
-        passed = 0
-        failed = 0
-        errors = 0
-        results = []
+        # Hold one connection for the whole run instead of one checkout per query,
+        # and run each distinct SELECT only once, with GX contexts kept for this run only
+        with InLaw._shared_connection(engine), InLaw._query_cache(), InLaw._gx_scope():
+            # Fuse all probe-style tests into one round-trip up front
+            probe_values = InLaw._run_probes(
+                engine=engine,
+                test_classes=[test_class for test_class in subclasses if test_class.probe_sql]
+            )
         
-        for test_class in subclasses:
-            test_title = getattr(test_class, 'title', test_class.__name__)
-            print(f"▶ Running: {test_title}")
+            passed = 0
+            failed = 0
+            errors = 0
+            results = []
             
-            try:
-                # Suppress only the specific result_format warning during test execution
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore",
-                        message=r".*result_format.*configured at the Validator-level will not be persisted.*",
-                        category=UserWarning
-                    )
-                    result = test_class.run(engine)
+            def run_one(test_class):
+                # Exceptions are returned rather than raised so a worker thread can hand them back
+                try:
+                    return InLaw._run_one(test_class=test_class, engine=engine, probe_values=probe_values)
+                except Exception as e:
+                    return e
+            
+            if max_workers is None:
+                max_workers = max(1, (os.cpu_count() or 1) - 2)
+            
+            executor = None
+            worker_connections = []
+            if max_workers > 1 and len(subclasses) > 1 and InLaw._is_parallel_safe(engine):
+                # Each worker holds one connection for the run and shares this run's query cache and GX scope
+                query_cache = _run_state.query_cache
+                gx_run = _run_state.gx_run
+                
+                def init_worker():
+                    _run_state.query_cache = query_cache
+                    _run_state.gx_run = gx_run
+                    try:
+                        conn = engine.connect()
+                    except Exception:
+                        # Let each test report the connection problem itself
+                        return
+                    worker_connections.append(conn)
+                    _run_state.connection = conn
                 
-                if result is True:
-                    print(InLaw.ansi_green("✅ PASS"))
-                    passed += 1
-                    results.append({"test": test_title, "status": "PASS", "message": None})
-                elif isinstance(result, str):
-                    print(InLaw.ansi_red(f"❌ FAIL: {result}"))
-                    failed += 1
-                    results.append({"test": test_title, "status": "FAIL", "message": result})
-                else:
-                    error_msg = f"Invalid return type from test: {type(result)}. Expected bool or str."
-                    print(InLaw.ansi_red(f"💥 ERROR: {error_msg}"))
-                    errors += 1
-                    results.append({"test": test_title, "status": "ERROR", "message": error_msg})
+                executor = ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(subclasses)),
+                    initializer=init_worker
+                )
+                outcomes = executor.map(run_one, subclasses)
+            else:
+                # Lazy, so each test runs right after its "Running" line is printed
+                outcomes = map(run_one, subclasses)
+            
+            try:
+                # Results are reported in definition order even when tests run in parallel
+                outcomes = iter(outcomes)
+                for test_class in subclasses:
+                    test_title = getattr(test_class, 'title', test_class.__name__)
+                    print(f"▶ Running: {test_title}")
+                    result = next(outcomes)
                     
-            except Exception as e:
-                error_msg = f"Exception in test: {str(e)}"
-                print(InLaw.ansi_red(f"💥 ERROR: {error_msg}"))
-                errors += 1
-                results.append({"test": test_title, "status": "ERROR", "message": error_msg})
+                    if result is True:
+                        print(_PASS_LINE)
+                        passed += 1
+                        results.append({"test": test_title, "status": "PASS", "message": None})
+                    elif isinstance(result, str):
+                        print(InLaw.ansi_red(f"❌ FAIL: {result}"))
+                        failed += 1
+                        results.append({"test": test_title, "status": "FAIL", "message": result})
+                    elif isinstance(result, Exception):
+                        error_msg = f"Exception in test: {str(result)}"
+                        print(InLaw.ansi_red(f"💥 ERROR: {error_msg}"))
+                        errors += 1
+                        results.append({"test": test_title, "status": "ERROR", "message": error_msg})
+                    else:
+                        error_msg = f"Invalid return type from test: {type(result)}. Expected bool or str."
+                        print(InLaw.ansi_red(f"💥 ERROR: {error_msg}"))
+                        errors += 1
+                        results.append({"test": test_title, "status": "ERROR", "message": error_msg})
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                    for conn in worker_connections:
+                        conn.close()
         
         # Print summary
         print("=" * 44)
@@ -297,19 +921,11 @@ class InLawExampleTest(InLaw):
         sql = "SELECT 1 as test_value"
         gx_df = InLaw.sql_to_gx_df(sql=sql, engine=engine)
         
-        # Suppress only the specific result_format warning during expectation calls
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message=r".*result_format.*configured at the Validator-level will not be persisted.*",
-                category=UserWarning
-            )
-            
-            result = gx_df.expect_column_values_to_be_between(
-                column="test_value", 
-                min_value=0, 
-                max_value=2
-            )
+        result = gx_df.expect_column_values_to_be_between(
+            column="test_value", 
+            min_value=0, 
+            max_value=2
+        )
         
         if result.success:
             return True
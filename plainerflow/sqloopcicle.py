@@ -9,8 +9,8 @@ TODO: When this loops over the SQL, to the left of the title of each query it sh
 how much it has left to do. 
 """
 
-from typing import Dict, Union, Mapping
-from sqlalchemy import text
+import re
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from sqlalchemy.engine import Engine
 import pandas as pd
 import time
@@ -18,6 +18,55 @@ import datetime as dt
 import human_readable
 
 
+# Single-statement INSERT ... VALUES (...): group 1 is everything up to and including
+# VALUES, group 2 the table and optional column list, group 3 the row tuple(s)
+_INSERT_VALUES_RE = re.compile(
+    r"\s*(INSERT\s+INTO\s+([^\s(]+\s*(?:\([^()]*\))?)\s*VALUES)\s*(\(.*\))\s*;?\s*\Z",
+    re.IGNORECASE | re.DOTALL
+)
+
+# A quoted identifier (kept verbatim) or a run of whitespace (collapsed) when
+# comparing the targets of neighbouring INSERTs
+_IDENTIFIER_OR_SPACE_RE = re.compile(r'("[^"]*"|`[^`]*`|\[[^\]]*\])|\s+')
+
+# Most INSERTs merged into one statement, so a long run (or a generator of
+# INSERTs) is still sent in bounded pieces; SQL Server allows 1000 rows per VALUES
+_MAX_INSERT_BATCH = 1000
+
+# Clauses that make an INSERT unsafe to merge with its neighbours
+_INSERT_UNBATCHABLE_RE = re.compile(
+    r"\b(?:ON\s+CONFLICT|ON\s+DUPLICATE|RETURNING|SELECT)\b|;",
+    re.IGNORECASE
+)
+
+# Statements run without parameters, so the driver is told not to look for
+# placeholders; a literal % then needs no escaping on format-style drivers
+_NO_PARAMETERS = {"no_parameters": True}
+
+# Displayed SELECTs also ask for a server-side cursor; drivers without one ignore it
+_STREAM_RESULTS = {"no_parameters": True, "stream_results": True}
+
+# Rows fetched at a time when counting the undisplayed rest of a SELECT
+_COUNT_PARTITION_ROWS = 10_000
+
+# Statement types are decided from the leading keyword, so only this much of the
+# statement is upper-cased; long statements are never copied whole
+_CLASSIFY_HEAD_CHARS = 32
+
+# Case-insensitive stand-in for `' AS SELECT' in sql.upper()` when spotting CTAS
+_AS_SELECT_RE = re.compile(r" AS SELECT", re.IGNORECASE)
+
+# Unicode icon for each statement type; the plain-text form is the type itself
+_SQL_TYPE_ICONS = {
+    'DROP': '🔻',
+    'INSERT': '📥',
+    'CTAS': '\033[32m⇲\033[0m',
+    'CREATE': '\033[32m▣\033[0m',
+    'SELECT': '🔍',
+    'EXEC': '▶',
+}
+
+
 class SQLoopcicle:
     """
     A single-purpose utility for looping over a mapping of SQL statements 
@@ -74,57 +123,126 @@ class SQLoopcicle:
                 Green ⇲/CTAS for CREATE TABLE AS SELECT (CTAS) statements
                 🔍/SELECT for SELECT statements
         """
-        # Normalize the SQL string for analysis
-        sql_upper = sql_string.strip().upper()
+        sql_type = SQLoopcicle._classify(sql_string)
+        return sql_type if is_plain_text else _SQL_TYPE_ICONS[sql_type]
+    
+    @staticmethod
+    def _classify(sql_string: str) -> str:
+        """
+        Return the statement type of sql_string: DROP, INSERT, CTAS, CREATE, SELECT or EXEC.
         
-        if is_plain_text:
-            # ASCII-compatible text alternatives
-            if sql_upper.startswith('DROP'):
-                return 'DROP'
-            elif sql_upper.startswith('INSERT'):
-                return 'INSERT'
-            elif sql_upper.startswith('CREATE TABLE') and ' AS SELECT' in sql_upper:
+        Only the first few characters are upper-cased to find the leading keyword;
+        the rest of the statement is scanned only to tell CTAS from a plain CREATE.
+        """
+        head = sql_string.lstrip()[:_CLASSIFY_HEAD_CHARS].upper()
+        
+        if head.startswith('DROP'):
+            return 'DROP'
+        elif head.startswith('INSERT'):
+            return 'INSERT'
+        elif head.startswith('CREATE'):
+            if head.startswith('CREATE TABLE') and _AS_SELECT_RE.search(sql_string):
                 return 'CTAS'
-            elif sql_upper.startswith('CREATE'):
-                return 'CREATE'
-            elif sql_upper.startswith('SELECT'):
-                return 'SELECT'
-            else:
-                return 'EXEC'
+            return 'CREATE'
+        elif head.startswith('SELECT'):
+            return 'SELECT'
         else:
-            # Unicode icons with ANSI color codes
-            GREEN = "\033[32m"
-            RESET = "\033[0m"
+            return 'EXEC'
+    
+    @staticmethod
+    def _insert_batch_prefix(sql_string: str) -> Optional[str]:
+        """
+        Return the statement's "table (cols)" target, with whitespace normalized, if
+        it can be merged with neighbouring INSERTs, otherwise None.
+        
+        Only the INSERT INTO / VALUES keywords are matched case-insensitively; the
+        target keeps its case, since quoted identifiers such as "Tab" and "tab"
+        name different tables.
+        """
+        match = _INSERT_VALUES_RE.match(sql_string)
+        if match is None or _INSERT_UNBATCHABLE_RE.search(match.group(3)):
+            return None
+        return _IDENTIFIER_OR_SPACE_RE.sub(lambda m: m.group(1) or ' ', match.group(2)).strip()
+    
+    @staticmethod
+    def _group_inserts(items: Iterable[Tuple[str, str]]) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Group consecutive INSERT ... VALUES statements that target the same table
+        and column list, at most _MAX_INSERT_BATCH to a group. Every other
+        statement is yielded in a group of its own.
+        
+        Args:
+            items: (key, sql_string) pairs in execution order
             
-            if sql_upper.startswith('DROP'):
-                return '🔻'
-            elif sql_upper.startswith('INSERT'):
-                return '📥'
-            elif sql_upper.startswith('CREATE TABLE') and ' AS SELECT' in sql_upper:
-                return f'{GREEN}⇲{RESET}'
-            elif sql_upper.startswith('CREATE'):
-                return f'{GREEN}▣{RESET}'
-            elif sql_upper.startswith('SELECT'):
-                return '🔍'
-            else:
-                return '▶'
+        Yields:
+            Lists of (key, sql_string) pairs, in the original order
+        """
+        group: List[Tuple[str, str]] = []
+        group_prefix = None
+        for key, sql_string in items:
+            prefix = SQLoopcicle._insert_batch_prefix(sql_string)
+            if group and (prefix is None or prefix != group_prefix or len(group) >= _MAX_INSERT_BATCH):
+                yield group
+                group = []
+            group.append((key, sql_string))
+            group_prefix = prefix
+            if prefix is None:
+                yield group
+                group = []
+        if group:
+            yield group
+    
+    @staticmethod
+    def _fuse_inserts(group: List[Tuple[str, str]]) -> str:
+        """
+        Merge a group from _group_inserts into one multi-row INSERT statement.
+        
+        Args:
+            group: (key, sql_string) pairs sharing the same INSERT prefix
+            
+        Returns:
+            str: A single INSERT ... VALUES (...), (...) statement
+        """
+        matches = [_INSERT_VALUES_RE.match(sql_string) for _, sql_string in group]
+        prefix = matches[0].group(1)
+        return prefix + "\n" + ",\n".join(match.group(3) for match in matches)
+    
+    @staticmethod
+    def _iter_items(
+        sql_dict: Union[Mapping[str, str], Iterable[Tuple[str, str]]]
+    ) -> Tuple[Iterator[Tuple[str, str]], Optional[int]]:
+        """
+        Return an iterator of (key, sql_string) pairs and the total count, if known.
+        
+        Mappings are iterated via .items() and report their length. Any other
+        iterable (list, generator, ...) is consumed lazily one pair at a time and
+        its total is None, so statements can be produced while earlier ones run.
+        """
+        if isinstance(sql_dict, Mapping):
+            return iter(sql_dict.items()), len(sql_dict)
+        return iter(sql_dict), None
     
     @staticmethod
     def run_sql_loop(
-        sql_dict: Mapping[str, str],
+        sql_dict: Union[Mapping[str, str], Iterable[Tuple[str, str]]],
         engine: Engine,
         *,
         is_just_print: bool = False,
         is_display_select: bool = True,
         select_display_rows: int = 50,
         is_plain_text_print: bool = False,
-        is_do_beep: bool = True
+        is_do_beep: bool = True,
+        is_batch_inserts: bool = False,
+        is_rollback_on_error: bool = False
     ) -> None:
         """
         Execute SQL statements from a dictionary in order.
         
         Args:
-            sql_dict: Mapping of keys to SQL statements. Executed in dictionary order.
+            sql_dict: Mapping of keys to SQL statements, or any iterable (e.g. a
+                     generator) of (key, sql_string) pairs. Executed in order.
+                     Iterables are consumed lazily and never materialized, so
+                     progress is shown as "(n)" instead of "(n of total)".
             engine: A live SQLAlchemy engine for database interaction.
             is_just_print: If True, SQL statements are printed instead of executed.
                           Keyword-only parameter.
@@ -134,6 +252,21 @@ class SQLoopcicle:
                                Keyword-only parameter. Defaults to 50.
             is_plain_text_print: If True, uses ASCII-compatible text instead of Unicode icons.
                                 Keyword-only parameter. Defaults to False.
+            is_do_beep: If True, beeps after each statement and when the loop finishes.
+                       Keyword-only parameter. Defaults to True.
+            is_batch_inserts: If True, consecutive `INSERT INTO t (cols) VALUES (...)`
+                             statements for the same table and columns are merged into
+                             one multi-row INSERT and executed in a single round-trip.
+                             A failure then rolls back the whole batch. Statements with
+                             ON CONFLICT, RETURNING or a SELECT are never merged.
+                             Keyword-only parameter. Defaults to False.
+            is_rollback_on_error: If True, the whole loop runs in one transaction that is
+                                 committed once at the end, and an error rolls back every
+                                 statement run so far. If False, each statement commits
+                                 as soon as it succeeds. Databases that commit DDL
+                                 implicitly (e.g. MySQL, Oracle) cannot roll back
+                                 CREATE/DROP statements. Keyword-only parameter.
+                                 Defaults to False.
         
         Raises:
             No exceptions are raised. SQL errors are caught and handled gracefully,
@@ -159,6 +292,7 @@ class SQLoopcicle:
             warning_icon = "WARNING"
             time_icon = "TIME"
             results_icon = "RESULTS"
+            batch_icon = "BATCH"
             error_icon = "ERROR"
             stop_icon = "STOP"
             dash_char = "-"
@@ -168,6 +302,7 @@ class SQLoopcicle:
             warning_icon = "🟡"
             time_icon = "⏱️"
             results_icon = "📊"
+            batch_icon = "🧺"
             error_icon = "❌"
             stop_icon = "🛑"
             dash_char = "–"
@@ -179,29 +314,52 @@ class SQLoopcicle:
             print(f"-- {start_icon} =====  EXECUTING SQL LOOP =====")
         
         # Single loop: print and execute each SQL statement
-        if not is_just_print and sql_dict:
-            total_queries = len(sql_dict)
+        items, total_queries = SQLoopcicle._iter_items(sql_dict)
+        of_total = f" of {total_queries}" if total_queries is not None else ""
+        if is_batch_inserts:
+            groups = SQLoopcicle._group_inserts(items)
+        else:
+            groups = ([item] for item in items)
+        
+        if not is_just_print and total_queries != 0:
             current_query = 0
             try:
                 with engine.connect() as conn:
-                    for key, sql_string in sql_dict.items():
-                        current_query += 1
-                        # Print the SQL statement with appropriate icon
-                        icon = SQLoopcicle.get_sql_type_icon(sql_string, is_plain_text=is_plain_text_print)
-                        print(f"-- {icon} ({current_query} of {total_queries}) {key}:")
-                        print(f"{sql_string}\n")
+                    if is_rollback_on_error and conn.dialect.name == "sqlite":
+                        # sqlite3 only opens a transaction before INSERT/UPDATE/DELETE,
+                        # so DDL at the start of the loop would commit on its own
+                        if not conn.connection.dbapi_connection.in_transaction:
+                            conn.exec_driver_sql("BEGIN")
+                    for group in groups:
+                        for key, sql_string in group:
+                            current_query += 1
+                            # Classify once; the type picks both the icon and the branch below
+                            sql_type = SQLoopcicle._classify(sql_string)
+                            icon = sql_type if is_plain_text_print else _SQL_TYPE_ICONS[sql_type]
+                            print(f"-- {icon} ({current_query}{of_total}) {key}:")
+                            print(f"{sql_string}\n")
                         
-                        sql_upper = sql_string.strip().upper()
+                        if len(group) > 1:
+                            # Run the merged statement once for the whole group
+                            key = f"{group[0][0]} .. {group[-1][0]}"
+                            sql_string = SQLoopcicle._fuse_inserts(group)
+                            sql_type = 'INSERT'
+                            print(f"-- {batch_icon} Batching {len(group)} INSERT statements ({key}) into one")
                         
                         # Handle SELECT queries differently if display is enabled
-                        if (sql_upper.startswith('SELECT') and 
-                            is_display_select and 
-                            not (sql_upper.startswith('CREATE TABLE') and ' AS SELECT' in sql_upper)):
+                        if sql_type == 'SELECT' and is_display_select:
                             
-                            # Use pandas to read and display SELECT results
+                            # Fetch only the rows to display into pandas. The rest are counted
+                            # in partitions, so memory stays bounded however large the result
+                            # is; with a server-side cursor (e.g. psycopg2) nothing is buffered.
                             try:
                                 start_time = time.time()
-                                select_data = pd.read_sql_query(sql_string, conn, params=None)
+                                with conn.exec_driver_sql(sql_string, execution_options=_STREAM_RESULTS) as result:
+                                    display_rows = result.fetchmany(select_display_rows) if select_display_rows > 0 else []
+                                    columns = list(result.keys())
+                                    total_rows = len(display_rows) + sum(
+                                        len(partition) for partition in result.partitions(_COUNT_PARTITION_ROWS)
+                                    )
                                 end_time = time.time()
                                 
                                 # Calculate and display execution time
@@ -210,25 +368,33 @@ class SQLoopcicle:
                                 readable_time = human_readable.precise_delta(time_delta, minimum_unit="seconds")
                                 print(f"-- {time_icon}  Query executed in: {readable_time}")
                                 
-                                if len(select_data) > 0:
-                                    # Limit rows displayed
-                                    display_data = select_data.head(select_display_rows)
-                                    print(f"-- {results_icon} Results for {key} (showing {len(display_data)} of {len(select_data)} rows):")
+                                if total_rows > 0:
+                                    display_data = pd.DataFrame.from_records(display_rows, columns=columns, coerce_float=True)
+                                    print(f"-- {results_icon} Results for {key} (showing {len(display_data)} of {total_rows} rows):")
                                     print(f"-- {display_data.to_string(index=False)}")
                                     print("-- ")  # Add blank line for readability
                                 else:
                                     print(f"-- {results_icon} Results for {key}: No rows returned")
                                     print("-- ")
                             except Exception as e:
+                                conn.rollback()
                                 print(f"-- {error_icon} Error executing SELECT query {key}: {e}")
+                                if is_rollback_on_error:
+                                    print(f"-- {stop_icon} Rolled back the loop's transaction")
                                 print(f"-- {stop_icon} SQL loop terminated due to error")
                                 return
                         else:
-                            # Execute non-SELECT queries or when display is disabled
+                            # Execute non-SELECT queries or when display is disabled.
+                            # Runs on the loop's connection and commits each statement
+                            # (or, with is_rollback_on_error, once after the loop),
+                            # rather than checking out a second connection per statement.
+                            # The SQL goes to the driver as-is: no text() bind parsing, so
+                            # literals like '10:30' are not mistaken for bind parameters.
                             try:
                                 start_time = time.time()
-                                with engine.begin() as trans_conn:
-                                    trans_conn.execute(text(sql_string))
+                                conn.exec_driver_sql(sql_string, execution_options=_NO_PARAMETERS)
+                                if not is_rollback_on_error:
+                                    conn.commit()
                                 end_time = time.time()
                                 
                                 # Calculate and display execution time
@@ -240,27 +406,33 @@ class SQLoopcicle:
                                 print(f"-- {time_icon}  Query executed in: {readable_time}")
                                 print("-----------------------------------------------------")  # Add blank line for readability
                             except Exception as e:
+                                conn.rollback()
                                 line = '-' * 80
                                 if(is_do_beep): 
                                     SQLoopcicle._beep(5)
                                 print(f"-- {error_icon} Error executing SQL query {key}:\n-- Error Start {line}v\n-- \n-- {e}\n-- \n-- ^{line}----------- Error End")
+                                if is_rollback_on_error:
+                                    print(f"-- {stop_icon} Rolled back the loop's transaction")
                                 print(f"-- {stop_icon} SQL loop terminated due to error")
                                 return
+                    conn.commit()
             except Exception as e:
                 SQLoopcicle._beep(5)
                 print(f"-- {error_icon} Database connection or general error:\n-- Error---\n-- \n-- {e}\n-- ---")
                 print(f"-- {stop_icon} SQL loop terminated due to error")
                 return
         else:
-            # Dry-run mode: just print the SQL statements
-            total_queries = len(sql_dict)
+            # Dry-run mode: just print the SQL statements (and the batching plan)
             current_query = 0
-            for key, sql_string in sql_dict.items():
-                current_query += 1
-                # Print the SQL statement with appropriate icon
-                icon = SQLoopcicle.get_sql_type_icon(sql_string, is_plain_text=is_plain_text_print)
-                print(f"-- {icon} ({current_query} of {total_queries}) {key}:")
-                print(f"{sql_string}\n")
+            for group in groups:
+                for key, sql_string in group:
+                    current_query += 1
+                    # Print the SQL statement with appropriate icon
+                    icon = SQLoopcicle.get_sql_type_icon(sql_string, is_plain_text=is_plain_text_print)
+                    print(f"-- {icon} ({current_query}{of_total}) {key}:")
+                    print(f"{sql_string}\n")
+                if len(group) > 1:
+                    print(f"-- {batch_icon} Would batch {len(group)} INSERT statements ({group[0][0]} .. {group[-1][0]}) into one")
         
         # Print end message
         print(f"-- {end_icon} ===== SQL LOOP COMPLETE =====\a\a")
@@ -273,3 +445,40 @@ class SQLoopcicle:
                 SQLoopcicle._beep(2)
                 time.sleep(2)
                 SQLoopcicle._beep(2, interval=1)
+    
+    @staticmethod
+    def run_sql_pipeline(
+        sql_dict: Union[Mapping[str, str], Iterable[Tuple[str, str]]],
+        engine: Engine
+    ) -> None:
+        """
+        Execute every SQL statement on one connection, in one transaction, without output.
+        
+        This is the quiet, fast counterpart of run_sql_loop for statements whose
+        results are not needed (DDL and DML). On psycopg (v3) engines the statements
+        are sent in pipeline mode, so the whole batch costs about one network
+        round-trip; other drivers run them back to back on the same connection
+        with a single commit at the end.
+        
+        Args:
+            sql_dict: Mapping of SQL statements, or an iterable of (key, sql_string)
+                     pairs consumed lazily, executed in order
+            engine: SQLAlchemy engine to execute against
+            
+        Raises:
+            Exception: Whatever the driver raises; the whole batch is rolled back
+        """
+        items, total = SQLoopcicle._iter_items(sql_dict)
+        if total == 0:
+            return
+        statements = (sql_string for _, sql_string in items)
+        
+        with engine.begin() as conn:
+            driver_conn = conn.connection.driver_connection
+            if conn.dialect.driver == "psycopg" and hasattr(driver_conn, "pipeline"):
+                with driver_conn.pipeline(), driver_conn.cursor() as cursor:
+                    for sql_string in statements:
+                        cursor.execute(sql_string)
+            else:
+                for sql_string in statements:
+                    conn.exec_driver_sql(sql_string, execution_options=_NO_PARAMETERS)
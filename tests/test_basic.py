@@ -17,6 +17,52 @@ def test_version_exists():
     assert plainerflow.__version__ is not None
 
 
+def test_import_is_lazy():
+    """Test that importing plainerflow does not import its submodules"""
+    import subprocess
+    import sys
+    code = (
+        "import sys, plainerflow; "
+        "print(any(name.startswith(('plainerflow.', 'marshmallow', 'great_expectations')) for name in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_credential_finder_defers_sqlalchemy():
+    """Test that SQLAlchemy is only imported once CredentialFinder builds an engine"""
+    import subprocess
+    import sys
+    code = (
+        "import sys; from plainerflow import CredentialFinder; "
+        "print('sqlalchemy' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_inlaw_defers_great_expectations():
+    """Test that Great Expectations is only imported once InLaw builds a validator"""
+    import subprocess
+    import sys
+    code = (
+        "import sys; from plainerflow import InLaw; "
+        "print('great_expectations' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_lazy_attribute_access():
+    """Test that public names resolve on first access"""
+    import plainerflow
+    from plainerflow.frostdict import FrostDict
+    assert plainerflow.FrostDict is FrostDict
+    assert "FrostDict" in dir(plainerflow)
+    with pytest.raises(AttributeError):
+        plainerflow.NotARealName
+
+
 def test_sqlalchemy_dependency():
     """Test that sqlalchemy is available (our main dependency)"""
     try:
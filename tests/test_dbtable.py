@@ -154,6 +154,10 @@ class TestDBTableValidation:
         # Test dots
         with pytest.raises(DBTableValidationError, match="contains invalid characters"):
             DBTable(database='my.database', table='users')
+        
+        # Test trailing newline
+        with pytest.raises(DBTableValidationError, match="contains invalid characters"):
+            DBTable(database='mydatabase\n', table='users')
     
     def test_valid_characters(self):
         """Test that valid characters are accepted."""
@@ -244,6 +248,21 @@ class TestDBTableStringRepresentation:
         table = DBTable(database='mydb', table='users')
         query = f"SELECT * FROM {table}"
         assert query == "SELECT * FROM mydb.users"
+    
+    def test_format_spec_usage(self):
+        """Test that format specs and str.format work with DBTable."""
+        table = DBTable(database='mydb', table='users')
+        assert f"{table:>12}" == "  mydb.users"
+        assert "FROM {}".format(table) == "FROM mydb.users"
+
+    
+    def test_no_instance_dict(self):
+        """Test that DBTable uses __slots__ instead of a per-instance __dict__."""
+        table = DBTable(database='mydb', table='users')
+        assert not hasattr(table, '__dict__')
+        assert not hasattr(table.make_child('staging'), '__dict__')
+        with pytest.raises(AttributeError):
+            table.extra = 'value'
 
 
 class TestDBTableChildCreation:
@@ -298,6 +317,15 @@ class TestDBTableChildCreation:
             table.table = None  # Artificially remove table
             table.make_child('backup')
     
+    def test_make_child_name_length_validation(self):
+        """Test that make_child still rejects a child name over the length limit."""
+        parent = DBTable(database='mydb', table='t' * 55)
+        
+        with pytest.raises(DBTableValidationError, match="exceeds 60 character limit"):
+            parent.make_child('toolong')
+        
+        assert str(parent.make_child('ok')) == f"mydb.{'t' * 55}_ok"
+    
     def test_make_child_suffix_validation(self):
         """Test that make_child validates suffix."""
         parent = DBTable(database='mydb', table='users')
@@ -430,6 +458,75 @@ class TestDBTableSQLAlchemyIntegration:
             
             assert orm_class.__name__ == 'UserViewModel'
     
+    def test_to_orm_is_cached_per_engine(self):
+        """Test that repeated to_orm calls for the same table reflect it only once."""
+        with patch('plainerflow.dbtable.Table') as mock_table, \
+             patch('plainerflow.dbtable.MetaData') as mock_metadata:
+            
+            mock_table.return_value = Mock()
+            
+            first = DBTable(database='testdb', table='users').to_orm(self.engine)
+            second = DBTable(db='testdb', table_name='users').to_orm(self.engine)
+            
+            assert second is first
+            mock_table.assert_called_once()
+            
+            # A different class name or engine builds a new class
+            assert DBTable(database='testdb', table='users').to_orm(self.engine, python_class_name='Other') is not first
+            assert DBTable(database='testdb', table='users').to_orm(create_engine("sqlite:///:memory:")) is not first
+    
+    def test_to_orm_reflects_each_table_once(self):
+        """Test that a new class name for an already reflected table runs no queries."""
+        from sqlalchemy import event
+        
+        table = DBTable(database='main', table='users')
+        # Plain base class: this test is about reflection, not mapping
+        with patch('plainerflow.dbtable.DeclarativeBase', type('Base', (), {})):
+            first = table.to_orm(self.engine)
+            
+            statements = []
+            event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+            second = table.to_orm(self.engine, python_class_name='UserAgain')
+        
+        assert second is not first
+        assert second.__table__ is first.__table__
+        assert statements == []
+    
+    def test_to_orm_uses_given_metadata(self):
+        """Test that a pre-reflected MetaData is used without reflecting again."""
+        from sqlalchemy import event
+        
+        metadata = MetaData()
+        metadata.reflect(bind=self.engine, schema='main')
+        
+        statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        with patch('plainerflow.dbtable.DeclarativeBase', type('Base', (), {})):
+            orm_class = DBTable(database='main', table='users').to_orm(self.engine, metadata=metadata)
+        
+        assert orm_class.__table__ is metadata.tables['main.users']
+        assert statements == []
+    
+    def test_clear_orm_cache_reflects_changed_table(self):
+        """Test that clear_orm_cache makes to_orm pick up a recreated table's columns."""
+        from sqlalchemy import text
+        
+        table = DBTable(database='main', table='users')
+        with patch('plainerflow.dbtable.DeclarativeBase', type('Base', (), {})):
+            before = table.to_orm(self.engine)
+            with self.engine.begin() as conn:
+                conn.execute(text("DROP TABLE users"))
+                conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, nickname TEXT)"))
+            
+            assert table.to_orm(self.engine) is before
+            DBTable.clear_orm_cache(self.engine)
+            after = table.to_orm(self.engine)
+            DBTable.clear_orm_cache()
+        
+        assert after is not before
+        assert 'nickname' in after.__table__.columns
+        assert 'nickname' not in before.__table__.columns
+    
     def test_to_orm_without_table_or_view(self):
         """Test that to_orm fails without table or view."""
         # Again, artificial scenario for error testing
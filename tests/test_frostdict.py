@@ -106,6 +106,47 @@ class TestFrostDictBasicFunctionality:
         assert fd.get('existing') == 'value'
         assert fd.get('nonexistent') is None
         assert fd.get('nonexistent', 'default') == 'default'
+    
+    def test_is_a_dict(self):
+        """Test that FrostDict can be passed anywhere a dict is expected."""
+        fd = FrostDict({'key': 'value'})
+        assert isinstance(fd, dict)
+        assert dict(fd) == {'key': 'value'}
+    
+    def test_update_adds_new_keys(self):
+        """Test that update() and |= can add brand-new keys."""
+        fd = FrostDict({'a': 1})
+        fd.update({'b': 2}, c=3)
+        fd |= {'d': 4}
+        assert fd == {'a': 1, 'b': 2, 'c': 3, 'd': 4}
+        assert isinstance(fd, FrostDict)
+    
+    def test_removing_keys_not_supported(self):
+        """Test that keys cannot be removed (which would allow re-assignment)."""
+        fd = FrostDict({'a': 1})
+        with pytest.raises(TypeError):
+            del fd['a']
+        with pytest.raises(TypeError):
+            fd.pop('a')
+        with pytest.raises(TypeError):
+            fd.popitem()
+        with pytest.raises(TypeError):
+            fd.clear()
+        assert fd == {'a': 1}
+    
+    def test_no_instance_dict(self):
+        """Test that FrostDict adds only its hash slot to a plain dict."""
+        import sys
+        fd = FrostDict({'a': 1})
+        assert not hasattr(fd, '__dict__')
+        assert sys.getsizeof(fd) - sys.getsizeof({'a': 1}) <= 16
+    
+    def test_copy_is_frostdict(self):
+        """Test that copy() keeps the frozen behavior."""
+        fd = FrostDict({'a': 1})
+        copied = fd.copy()
+        assert isinstance(copied, FrostDict)
+        assert copied == fd
 
 
 class TestFrostDictFrozenBehavior:
@@ -184,6 +225,39 @@ class TestFrostDictFrozenBehavior:
         assert 'key' in str(exc_info.value)
         assert 'FrostDict' in str(exc_info.value)
 
+    def test_frozen_key_error_caller_location(self):
+        """Test that FrozenKeyError points at the user code, not at frostdict.py."""
+        import inspect
+        expected_line = inspect.currentframe().f_lineno + 1
+        error = FrozenKeyError('key')
+        
+        assert error.caller_info == {
+            'filename': __file__,
+            'lineno': expected_line,
+            'function': 'test_frozen_key_error_caller_location'
+        }
+
+    
+    def test_friendly_error_display_shows_code_context(self):
+        """Test that the friendly display shows the offending source line and is built once."""
+        error = FrozenKeyError('key')  # offending line
+        
+        display = error.get_friendly_error_display()
+        assert "FrozenKeyError('key')  # offending line" in display
+        assert error.get_friendly_error_display() is display
+
+    
+    def test_caught_error_skips_friendly_display(self):
+        """Test that reassignment raises without rendering the display until the error is shown."""
+        fd = FrostDict({'key': 'value'})
+        
+        with pytest.raises(FrozenKeyError) as exc_info:
+            fd['key'] = 'new_value'
+        
+        assert exc_info.value._friendly_display is None
+        assert str(exc_info.value) == "Cannot reassign existing key 'key' in FrostDict"
+        assert "FrostDict Key Conflict" in exc_info.value.get_friendly_error_display()
+
 
 class TestFrostDictNestedMutability:
     """Test that nested values remain mutable."""
@@ -312,6 +386,25 @@ class TestFrostDictValueTypes:
 class TestFrostDictHashability:
     """Test hashability requirements."""
     
+    def test_hash_updates_when_key_added(self):
+        """Test that the cached hash is refreshed after adding a new key."""
+        fd = FrostDict({'a': 1})
+        first_hash = hash(fd)
+        assert hash(fd) == first_hash
+        
+        fd['b'] = 2
+        assert hash(fd) == hash(FrostDict({'a': 1, 'b': 2}))
+    
+    def test_hash_updates_when_setdefault_adds_key(self):
+        """Test that setdefault refreshes the cached hash and never re-assigns."""
+        fd = FrostDict({'a': 1})
+        hash(fd)
+        
+        assert fd.setdefault('b', 2) == 2
+        assert hash(fd) == hash(FrostDict({'a': 1, 'b': 2}))
+        assert fd.setdefault('a', 99) == 1
+        assert fd['a'] == 1
+    
     def test_hashable_with_hashable_values(self):
         """Test that FrostDict is hashable when all values are hashable."""
         fd = FrostDict({
@@ -358,6 +451,11 @@ class TestFrostDictHashability:
         fd3 = FrostDict({'b': 2, 'a': 1})
         assert hash(fd1) == hash(fd3)
     
+    def test_hash_with_mixed_key_types(self):
+        """Test that keys of different types (which cannot be sorted together) still hash."""
+        fd = FrostDict({1: 'one', 'two': 2, (3,): 'three'})
+        assert hash(fd) == hash(FrostDict({(3,): 'three', 'two': 2, 1: 'one'}))
+    
     def test_hash_different_for_different_content(self):
         """Test that different content produces different hashes."""
         fd1 = FrostDict({'a': 1})
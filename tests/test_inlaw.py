@@ -5,6 +5,7 @@ Tests for the InLaw Great Expectations wrapper.
 import pytest
 import sqlalchemy
 from plainerflow import InLaw
+from plainerflow.inlaw import _quiet_gx_checkpoint_warning
 
 
 class TestInLawBasicPass(InLaw):
@@ -85,6 +86,30 @@ def test_inlaw_sql_to_gx_df():
     assert result.success
 
 
+def test_inlaw_sql_to_gx_df_reuses_context():
+    """Test that GX context setup happens once per run and each call still gets its own validator."""
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    
+    with InLaw._gx_scope():
+        first = InLaw.sql_to_gx_df(sql="SELECT 1 AS one", engine=engine)
+        second = InLaw.sql_to_gx_df(sql="SELECT 2 AS two", engine=engine)
+    third = InLaw.sql_to_gx_df(sql="SELECT 3 AS three", engine=engine)
+    
+    assert first.data_context is second.data_context
+    assert third.data_context is not first.data_context
+    assert first is not second
+    with _quiet_gx_checkpoint_warning():
+        assert first.expect_column_values_to_be_between(column="one", min_value=1, max_value=1).success
+        assert second.expect_column_values_to_be_between(column="two", min_value=2, max_value=2).success
+
+def test_inlaw_assert_zero_rows():
+    """Test assert_zero_rows counts matching rows in the database."""
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    
+    assert InLaw.assert_zero_rows(sql="SELECT 1 WHERE 1 = 0", engine=engine) is True
+    assert InLaw.assert_zero_rows(sql="SELECT 1 UNION ALL SELECT 2;", engine=engine) == "Expected zero rows, found 2"
+    assert InLaw.assert_zero_rows(sql="SELECT 1", engine=engine, fail_msg="Found rows") == "Found rows"
+
 def test_inlaw_ansi_colors():
     """Test ANSI color helper methods."""
     green_text = InLaw.ansi_green("PASS")
@@ -137,6 +162,374 @@ def test_inlaw_invalid_return_type():
     assert results['errors'] >= 1
 
 
+def test_inlaw_probe_tests():
+    """Test that probe_sql tests are checked and a broken probe only errors itself."""
+    
+    class TestInLawProbePass(InLaw):
+        title = "Probe passing test"
+        probe_sql = "SELECT 1"
+        
+        @staticmethod
+        def check(value):
+            return True if value == 1 else "Probe value was not 1"
+    
+    class TestInLawProbeFail(InLaw):
+        title = "Probe failing test"
+        probe_sql = "SELECT 5"
+        
+        @staticmethod
+        def check(value):
+            return True if value == 1 else "Probe value was not 1"
+    
+    class TestInLawProbeBroken(InLaw):
+        title = "Probe broken test"
+        probe_sql = "SELECT FROM invalid_syntax"
+        
+        @staticmethod
+        def check(value):
+            return True
+    
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    results = InLaw.run_all(engine=engine)
+    
+    statuses = {result["test"]: result["status"] for result in results["results"]}
+    assert statuses["Probe passing test"] == "PASS"
+    assert statuses["Probe failing test"] == "FAIL"
+    assert statuses["Probe broken test"] == "ERROR"
+
+
+def test_inlaw_declarative_tests():
+    """Test that sql + expect tests run their expectation without a run() method."""
+    
+    class TestInLawDeclarativePass(InLaw):
+        title = "Declarative passing test"
+        sql = "SELECT 5 AS five"
+        expect = ("between", "five", 1, 10)
+    
+    class TestInLawDeclarativeFail(InLaw):
+        title = "Declarative failing test"
+        sql = "SELECT 5 AS five"
+        expect = ("between", "five", 6, 10)
+        fail_msg = "Five was not between 6 and 10"
+    
+    class TestInLawDeclarativeUnknown(InLaw):
+        title = "Declarative unknown expectation test"
+        sql = "SELECT 5 AS five"
+        expect = ("no_such_expectation", "five")
+    
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    results = InLaw.run_all(engine=engine)
+    
+    by_title = {result["test"]: result for result in results["results"]}
+    assert by_title["Declarative passing test"]["status"] == "PASS"
+    assert by_title["Declarative failing test"]["status"] == "FAIL"
+    assert by_title["Declarative failing test"]["message"] == "Five was not between 6 and 10"
+    assert by_title["Declarative unknown expectation test"]["status"] == "ERROR"
+
+def test_inlaw_run_all_shares_connection():
+    """Test that queries made during run_all reuse one connection."""
+    
+    class TestInLawSharedConnection(InLaw):
+        title = "Shared connection test"
+        
+        @staticmethod
+        def run(engine):
+            with InLaw._connect(engine) as first, InLaw._connect(engine) as second:
+                return True if first is second else "Connection was not shared"
+    
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    results = InLaw.run_all(engine=engine)
+    
+    statuses = {result["test"]: result["status"] for result in results["results"]}
+    assert statuses["Shared connection test"] == "PASS"
+
+
+def test_inlaw_run_all_parallel(tmp_path):
+    """Test that max_workers runs tests on worker threads and reports them in order."""
+    import threading
+    import plainerflow.inlaw as inlaw_module
+    
+    thread_names = set()
+    
+    class TestInLawParallelOne(InLaw):
+        title = "Parallel test one"
+        
+        @staticmethod
+        def run(engine):
+            thread_names.add(threading.current_thread().name)
+            with InLaw._connect(engine) as conn:
+                if conn is not inlaw_module._run_state.connection:
+                    return "Worker did not reuse its connection"
+                return True if conn.execute(sqlalchemy.text("SELECT 1")).scalar() == 1 else "Bad result"
+    
+    class TestInLawParallelTwo(InLaw):
+        title = "Parallel test two"
+        
+        @staticmethod
+        def run(engine):
+            thread_names.add(threading.current_thread().name)
+            return "Expected failure"
+    
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'parallel.db'}")
+    results = InLaw.run_all(engine=engine, max_workers=4)
+    
+    titles = [result["test"] for result in results["results"]]
+    assert titles.index("Parallel test one") < titles.index("Parallel test two")
+    statuses = {result["test"]: result["status"] for result in results["results"]}
+    assert statuses["Parallel test one"] == "PASS"
+    assert statuses["Parallel test two"] == "FAIL"
+    assert threading.current_thread().name not in thread_names
+    assert engine.pool.checkedout() == 0
+
+
+def test_inlaw_run_all_parallel_gx_tests(tmp_path):
+    """Test that GX-based tests can run on several workers and leave no context behind."""
+    import plainerflow.inlaw as inlaw_module
+
+    for n in range(4):
+        type(f"TestInLawParallelGX{n}", (InLaw,), {
+            "title": f"Parallel GX test {n}",
+            "sql": f"SELECT {n} AS n",
+            "expect": ("between", "n", n, n),
+        })
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'parallel_gx.db'}")
+    results = InLaw.run_all(engine=engine, max_workers=4)
+
+    statuses = {result["test"]: result["status"] for result in results["results"]}
+    assert [statuses[f"Parallel GX test {n}"] for n in range(4)] == ["PASS"] * 4
+    assert getattr(inlaw_module._gx_state, "context", None) is None
+
+
+def test_inlaw_run_all_auto_workers(tmp_path):
+    """Test that max_workers=None sizes the pool from the CPU count."""
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import patch
+    
+    class TestInLawAutoWorkersOne(InLaw):
+        title = "Auto workers one"
+        
+        @staticmethod
+        def run(engine):
+            return True
+    
+    class TestInLawAutoWorkersTwo(InLaw):
+        title = "Auto workers two"
+        
+        @staticmethod
+        def run(engine):
+            return True
+    
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'auto.db'}")
+    with patch("plainerflow.inlaw.os.cpu_count", return_value=6), \
+         patch("plainerflow.inlaw.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_executor:
+        results = InLaw.run_all(engine=engine, max_workers=None)
+    
+    assert mock_executor.call_args.kwargs["max_workers"] == min(4, results["total"])
+    statuses = {result["test"]: result["status"] for result in results["results"]}
+    assert statuses["Auto workers one"] == statuses["Auto workers two"] == "PASS"
+
+def test_inlaw_scalar():
+    """Test that scalar returns the single value of a query."""
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    assert InLaw.scalar(sql="SELECT COUNT(*) FROM (SELECT 1 UNION ALL SELECT 2)", engine=engine) == 2
+    with pytest.raises(sqlalchemy.exc.MultipleResultsFound):
+        InLaw.scalar(sql="SELECT 1 UNION ALL SELECT 2", engine=engine)
+
+
+def test_inlaw_first_row():
+    """Test that first_row returns the single row of a query as a dictionary."""
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    assert InLaw.first_row(sql="SELECT 1 AS low, 5 AS high", engine=engine) == {"low": 1, "high": 5}
+    with pytest.raises(sqlalchemy.exc.NoResultFound):
+        InLaw.first_row(sql="SELECT 1 AS low WHERE 0", engine=engine)
+
+
+def test_inlaw_scalars():
+    """Test that scalars fetches several values in one query."""
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    executed = []
+    sqlalchemy.event.listen(engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+    
+    values = InLaw.scalars(sql_dict={"one": "SELECT 1;", "two": "SELECT 2"}, engine=engine)
+    
+    assert values == {"one": 1, "two": 2}
+    assert len(executed) == 1
+    assert InLaw.scalars(sql_dict={}, engine=engine) == {}
+
+
+def test_inlaw_reads_query_as_one_frame():
+    """Test that a query result comes back as one DataFrame typed from every row."""
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    sql = "SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4.5 UNION ALL SELECT 5"
+    
+    pandas_df = InLaw._read_sql(sql=sql, engine=engine)
+    
+    assert pandas_df["n"].tolist() == [1, 2, 3, 4.5, 5]
+    assert pandas_df["n"].dtype == "float64"
+    assert pandas_df.index.tolist() == [0, 1, 2, 3, 4]
+    assert InLaw._read_sql(sql="SELECT 1 AS n WHERE 0", engine=engine).columns.tolist() == ["n"]
+
+
+def test_inlaw_parallel_safety():
+    """Test that in-memory SQLite only runs in parallel on a StaticPool."""
+    assert not InLaw._is_parallel_safe(sqlalchemy.create_engine("sqlite:///:memory:"))
+    assert InLaw._is_parallel_safe(
+        sqlalchemy.create_engine("sqlite:///:memory:", poolclass=sqlalchemy.pool.StaticPool)
+    )
+
+def test_inlaw_run_all_caches_repeated_sql():
+    """Test that tests issuing the same SQL during run_all hit the database once."""
+    executed = []
+    
+    class TestInLawCachedQueryOne(InLaw):
+        title = "Cached query test one"
+        
+        @staticmethod
+        def run(engine):
+            df = InLaw._read_sql(sql="SELECT 42 AS answer", engine=engine)
+            return True if df["answer"][0] == 42 else "Answer was not 42"
+    
+    class TestInLawCachedQueryTwo(InLaw):
+        title = "Cached query test two"
+        
+        @staticmethod
+        def run(engine):
+            df = InLaw._read_sql(sql="  SELECT 42\n AS answer ", engine=engine)
+            return True if df["answer"][0] == 42 else "Answer was not 42"
+    
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    
+    @sqlalchemy.event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+    
+    results = InLaw.run_all(engine=engine)
+    
+    statuses = {result["test"]: result["status"] for result in results["results"]}
+    assert statuses["Cached query test one"] == "PASS"
+    assert statuses["Cached query test two"] == "PASS"
+    # Other registered tests may run "SELECT 42 as answer"; count only this test's statement
+    assert sum(" ".join(statement.split()) == "SELECT 42 AS answer" for statement in executed) == 1
+
+def test_inlaw_import_file_is_cached(tmp_path):
+    """Test that repeat imports of an unchanged file reuse the cached module."""
+    test_file = tmp_path / "inlaw_cached_file.py"
+    test_file.write_text(
+        "from plainerflow import InLaw\n"
+        "class CachedFileTest(InLaw):\n"
+        "    title = 'Cached file test'\n"
+        "    @staticmethod\n"
+        "    def run(engine):\n"
+        "        return True\n"
+    )
+    
+    assert InLaw._import_file(file_path=str(test_file)) is True
+    assert InLaw._import_file(file_path=str(test_file)) is False
+    
+    discovered = [cls for cls in InLaw._discover_subclasses() if cls.__name__ == "CachedFileTest"]
+    assert len(discovered) == 1
+
+
+def test_inlaw_import_directory(tmp_path):
+    """Test that a test directory loads its .py files once and skips everything else."""
+    from unittest.mock import patch
+    
+    (tmp_path / "inlaw_dir_scan_tests.py").write_text(
+        "from plainerflow import InLaw\n"
+        "\n"
+        "class InLawDirScanTest(InLaw):\n"
+        "    title = 'Directory scan test'\n"
+        "\n"
+        "    @staticmethod\n"
+        "    def run(engine):\n"
+        "        return True\n"
+    )
+    (tmp_path / "__init__.py").write_text("raise RuntimeError('should not be imported')\n")
+    (tmp_path / "not_a_file.py").mkdir()
+    (tmp_path / "notes.txt").write_text("not python\n")
+    
+    with patch.object(InLaw, "_load_inlaw_file", wraps=InLaw._load_inlaw_file) as mock_load:
+        InLaw._import_directory(directory_path=str(tmp_path))
+        InLaw._import_directory(directory_path=str(tmp_path))
+    
+    assert mock_load.call_count == 1
+    titles = [test_class.title for test_class in InLaw._discover_subclasses()]
+    assert titles.count("Directory scan test") == 1
+
+
+def test_inlaw_load_file_uses_standard_loader(tmp_path):
+    """Test that test files are executed by the normal source loader."""
+    test_file = tmp_path / "inlaw_loaded_file.py"
+    test_file.write_text("VALUE = 7\n")
+    
+    module = InLaw._load_inlaw_file(file_path=str(test_file), module_name="inlaw_loaded_file")
+    assert module.VALUE == 7
+    assert module.__file__ == str(test_file)
+    assert module.__spec__.cached is not None
+
+def test_inlaw_registry_dedupes_redefined_classes():
+    """Test that redefining a test class (e.g. on re-import) keeps only the newest one."""
+    source = (
+        "from plainerflow import InLaw\n"
+        "class RedefinedTest(InLaw):\n"
+        "    title = 'Redefined test'\n"
+        "    @staticmethod\n"
+        "    def run(engine):\n"
+        "        return True\n"
+    )
+    first = {"__name__": "inlaw_redefined_module"}
+    second = {"__name__": "inlaw_redefined_module"}
+    exec(source, first)
+    exec(source, second)
+    
+    discovered = [cls for cls in InLaw._discover_subclasses() if cls.__name__ == "RedefinedTest"]
+    assert discovered == [second["RedefinedTest"]]
+
+def test_inlaw_same_named_files_in_different_directories(tmp_path):
+    """Test that same-named test files in different directories keep all their classes."""
+    for suite in ("suite_a", "suite_b"):
+        suite_dir = tmp_path / suite
+        suite_dir.mkdir()
+        (suite_dir / "checks.py").write_text(
+            "from plainerflow import InLaw\n"
+            "class SameNamedCheck(InLaw):\n"
+            f"    title = 'Same-named check from {suite}'\n"
+            "    @staticmethod\n"
+            "    def run(engine):\n"
+            "        return True\n"
+        )
+        InLaw._import_directory(directory_path=str(suite_dir))
+    
+    titles = [test_class.title for test_class in InLaw._discover_subclasses()]
+    assert "Same-named check from suite_a" in titles
+    assert "Same-named check from suite_b" in titles
+
+def test_inlaw_discovery_skips_helper_bases():
+    """Test that intermediate bases without run, probe_sql or expect are not run as tests."""
+    import gc
+    
+    class InLawHelperBase(InLaw):
+        @staticmethod
+        def helper():
+            return True
+    
+    class InLawHelperChild(InLawHelperBase):
+        title = "Helper child test"
+        
+        @staticmethod
+        def run(engine):
+            return InLawHelperBase.helper()
+    
+    discovered = InLaw._discover_subclasses()
+    assert InLawHelperChild in discovered
+    assert InLawHelperBase not in discovered
+    
+    # The registry does not keep discarded classes alive
+    del InLawHelperBase, InLawHelperChild, discovered
+    gc.collect()
+    assert "InLawHelperChild" not in [cls.__name__ for cls in InLaw._discover_subclasses()]
+
 def test_inlaw_abstract_class():
     """Test that InLaw is properly abstract."""
     with pytest.raises(TypeError):
@@ -6,7 +6,7 @@ error propagation, and integration with SQLAlchemy engines using SQLite.
 """
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from plainerflow.sqloopcicle import SQLoopcicle
@@ -85,6 +85,170 @@ class TestSQLoopcicleBasicFunctionality:
             result = conn.execute(text("SELECT name FROM users WHERE id = 1")).scalar()
             assert result == 'Alice'
     
+
+    def test_batch_inserts(self, capsys):
+        """Test that consecutive INSERTs into the same table are merged into one statement."""
+        sql_dict = {
+            "create_table": "CREATE TABLE users (id INTEGER, name TEXT)",
+            "insert_1": "INSERT INTO users (id, name) VALUES (1, 'Alice')",
+            "insert_2": "insert into users (id, name) values (2, 'Bob');",
+            "insert_3": "INSERT INTO users (id, name) VALUES (3, 'Carol')",
+            "update": "UPDATE users SET name = 'Al' WHERE id = 1",
+            "insert_4": "INSERT INTO users (id, name) VALUES (4, 'Dan')"
+        }
+        
+        SQLoopcicle.run_sql_loop(sql_dict, self.engine, is_just_print=False,
+                                 is_do_beep=False, is_batch_inserts=True)
+        
+        captured = capsys.readouterr()
+        assert "Batching 3 INSERT statements (insert_1 .. insert_3) into one" in captured.out
+        assert captured.out.count("Batching") == 1
+        assert "(6 of 6) insert_4:" in captured.out
+        
+        with self.engine.begin() as conn:
+            rows = conn.execute(text("SELECT id, name FROM users ORDER BY id")).fetchall()
+        assert rows == [(1, 'Al'), (2, 'Bob'), (3, 'Carol'), (4, 'Dan')]
+
+    def test_batch_inserts_keep_identifier_case(self):
+        """Test that INSERTs into quoted tables differing only in case are not merged."""
+        items = [
+            ("upper", 'INSERT INTO "Tab" VALUES (1)'),
+            ("lower", 'insert into "tab" values (2)'),
+            ("lower_again", 'INSERT  INTO "tab"   VALUES (3)')
+        ]
+        
+        groups = [[key for key, _ in group] for group in SQLoopcicle._group_inserts(items)]
+        
+        assert groups == [["upper"], ["lower", "lower_again"]]
+
+    def test_batch_inserts_are_bounded(self, monkeypatch):
+        """Test that a long run of INSERTs is split into groups of at most _MAX_INSERT_BATCH."""
+        import plainerflow.sqloopcicle as sqloopcicle_module
+        monkeypatch.setattr(sqloopcicle_module, "_MAX_INSERT_BATCH", 2)
+        items = ((f"insert_{n}", f"INSERT INTO t (id) VALUES ({n})") for n in range(5))
+        
+        sizes = [len(group) for group in SQLoopcicle._group_inserts(items)]
+        
+        assert sizes == [2, 2, 1]
+
+    def test_select_display_fetches_only_shown_rows(self, capsys):
+        """Test that a displayed SELECT shows the first rows and still reports the total."""
+        sql_dict = {
+            "create_table": "CREATE TABLE numbers (n INTEGER)",
+            "insert_data": "INSERT INTO numbers VALUES (1), (2), (3), (4), (5)",
+            "select_numbers": "SELECT n FROM numbers ORDER BY n",
+            "select_none": "SELECT n FROM numbers WHERE n > 5"
+        }
+        
+        SQLoopcicle.run_sql_loop(sql_dict, self.engine, is_just_print=False,
+                                 is_do_beep=False, select_display_rows=2)
+        
+        captured = capsys.readouterr()
+        assert "Results for select_numbers (showing 2 of 5 rows):" in captured.out
+        assert "Results for select_none: No rows returned" in captured.out
+
+    def test_colon_literals_are_not_binds(self):
+        """Test that ':word' inside a SQL literal is sent as-is, not parsed as a bind parameter."""
+        sql_dict = {
+            "create_table": "CREATE TABLE events (id INTEGER, note TEXT)",
+            "insert_data": "INSERT INTO events VALUES (1, 'starts at 10:30, see :notes')"
+        }
+        
+        SQLoopcicle.run_sql_loop(sql_dict, self.engine, is_just_print=False, is_do_beep=False)
+        
+        with self.engine.begin() as conn:
+            note = conn.execute(text("SELECT note FROM events")).scalar()
+        assert note == "starts at 10:30, see :notes"
+
+    def test_sql_type_icon(self):
+        """Test statement classification, including lower-case and indented CTAS."""
+        icon = lambda sql: SQLoopcicle.get_sql_type_icon(sql, is_plain_text=True)
+        assert icon("DROP TABLE t") == 'DROP'
+        assert icon("insert into t values (1)") == 'INSERT'
+        assert icon("\n    create table t2 as select * from t") == 'CTAS'
+        assert icon("CREATE TABLE t (id INTEGER)") == 'CREATE'
+        assert icon("  SELECT 1") == 'SELECT'
+        assert icon("UPDATE t SET id = 2") == 'EXEC'
+        assert SQLoopcicle.get_sql_type_icon("SELECT 1") == '🔍'
+
+    def test_rollback_on_error(self, capsys):
+        """Test that is_rollback_on_error undoes earlier statements when a later one fails."""
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER)"))
+
+        sql_dict = {
+            "insert_one": "INSERT INTO items VALUES (1)",
+            "insert_two": "INSERT INTO items VALUES (2)",
+            "broken": "INSERT INTO missing_table VALUES (3)"
+        }
+
+        SQLoopcicle.run_sql_loop(
+            sql_dict, self.engine, is_do_beep=False, is_rollback_on_error=True
+        )
+
+        with self.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 0
+        assert "Rolled back the loop's transaction" in capsys.readouterr().out
+
+        # Without the flag each statement is committed as it runs
+        SQLoopcicle.run_sql_loop(sql_dict, self.engine, is_do_beep=False)
+
+        with self.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2
+
+    def test_rollback_on_error_includes_ddl(self):
+        """Test that is_rollback_on_error also rolls back tables created inside the loop."""
+        sql_dict = {
+            "create_table": "CREATE TABLE staged (id INTEGER)",
+            "insert_data": "INSERT INTO staged VALUES (1)",
+            "broken": "INSERT INTO missing_table VALUES (2)"
+        }
+
+        SQLoopcicle.run_sql_loop(
+            sql_dict, self.engine, is_do_beep=False, is_rollback_on_error=True
+        )
+
+        with self.engine.connect() as conn:
+            tables = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()
+        assert tables == []
+
+        # A successful loop is committed once at the end
+        del sql_dict["broken"]
+        SQLoopcicle.run_sql_loop(
+            sql_dict, self.engine, is_do_beep=False, is_rollback_on_error=True
+        )
+
+        with self.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM staged")).scalar() == 1
+
+    def test_generator_input_is_streamed(self, capsys):
+        """Test that a generator of (key, sql) pairs is consumed lazily, one statement at a time."""
+        produced = []
+        
+        def statements():
+            for key, sql_string in [
+                ("create_table", "CREATE TABLE users (id INTEGER, name TEXT)"),
+                ("insert_1", "INSERT INTO users (id, name) VALUES (1, 'Alice')"),
+                ("insert_2", "INSERT INTO users (id, name) VALUES (2, 'Bob')")
+            ]:
+                # Every earlier statement has already run by the time the next is built
+                with self.engine.connect() as conn:
+                    produced.append(conn.execute(text(
+                        "SELECT COUNT(*) FROM sqlite_master WHERE name = 'users'"
+                    )).scalar())
+                yield key, sql_string
+        
+        SQLoopcicle.run_sql_loop(statements(), self.engine, is_just_print=False, is_do_beep=False)
+        
+        captured = capsys.readouterr()
+        assert "(1) create_table:" in captured.out
+        assert "(3) insert_2:" in captured.out
+        assert produced == [0, 1, 1]
+        
+        with self.engine.begin() as conn:
+            rows = conn.execute(text("SELECT id, name FROM users ORDER BY id")).fetchall()
+        assert rows == [(1, 'Alice'), (2, 'Bob')]
+
     def test_default_execution_mode(self, capsys):
         """Test that default mode is execution (not dry-run)."""
         sql_dict = {"create_table": "CREATE TABLE test_table (id INTEGER)"}
@@ -397,6 +561,52 @@ class TestSQLoopcicleIntegration:
             assert count == 1
 
 
+class TestSQLoopcicleRunSqlPipeline:
+    """Test run_sql_pipeline batch execution."""
+    
+    def setup_method(self):
+        """Set up test database for each test."""
+        self.engine = create_engine("sqlite:///:memory:")
+    
+    def test_pipeline_executes_in_order(self, capsys):
+        """Test that all statements run, in order, without console output."""
+        sql_dict = {
+            "create_table": "CREATE TABLE items (id INTEGER, label TEXT)",
+            "insert_one": "INSERT INTO items VALUES (1, '100%')",
+            "insert_two": "INSERT INTO items VALUES (2, 'b')"
+        }
+        
+        no_parameters = []
+        
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            no_parameters.append(context.execution_options.get("no_parameters"))
+        
+        SQLoopcicle.run_sql_pipeline(sql_dict, self.engine)
+        
+        assert capsys.readouterr().out == ""
+        # No parameters, so format-style drivers (psycopg2, pymysql) leave '%' alone
+        assert no_parameters == [True, True, True]
+        with self.engine.connect() as conn:
+            rows = conn.execute(text("SELECT id, label FROM items ORDER BY id")).fetchall()
+        assert rows == [(1, '100%'), (2, 'b')]
+    
+    def test_pipeline_rolls_back_on_error(self):
+        """Test that a failing statement raises and rolls back the whole batch."""
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER)"))
+        
+        sql_dict = {
+            "insert_one": "INSERT INTO items VALUES (1)",
+            "broken": "INSERT INTO missing_table VALUES (2)"
+        }
+        
+        with pytest.raises(SQLAlchemyError):
+            SQLoopcicle.run_sql_pipeline(sql_dict, self.engine)
+        
+        with self.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 0
+
 class TestSQLoopcicleTypeHints:
     """Test type hint compliance and parameter validation."""
     